@@ -0,0 +1,272 @@
+import argparse
+import asyncio
+import base64
+import json
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+import ConceptAquisitionSimulation as cas
+
+# Reason phrases for the status codes the server sends
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+# Define Chatbot Server
+class ChatbotServer:
+    """
+    An asyncio HTTP/JSON server exposing the concept acquisition chatbot.
+    Text explanations are assembled directly on the event loop, while AI concept maps are
+    rendered off-screen in an executor, so one process can serve many users at once. At most
+    `max_concurrency` requests are processed concurrently; beyond `max_pending` waiting requests
+    the server sheds load with 503, and requests exceeding `request_timeout` get 504.
+
+    Endpoints:
+        GET  /concepts     the numbered concepts
+        GET  /categories   the categories of concept acquisition
+        GET  /related      query parameters concept (number or name) and optionally k, the
+                           most similar concepts
+        GET  /explain      query parameters user_input (a concept number, name, synonym,
+                           prefix or misspelling), cognitive_system, category and optionally
+                           map=0 to skip the concept map; an unresolved concept answers 400
+                           with the candidate concepts
+        POST /explain      the same fields as a JSON object
+    """
+    def __init__(self, host="127.0.0.1", port=8080, max_concurrency=8, max_pending=64,
+            request_timeout=10.0, output_format="png", executor=None, max_body=64 * 1024):
+        """
+        :param host: str, interface to listen on
+        :param port: int, port to listen on
+        :param max_concurrency: int, maximum number of requests processed concurrently
+        :param max_pending: int, maximum number of requests admitted (processing or waiting)
+                        before new ones are rejected with 503
+        :param request_timeout: float, seconds allowed to read and answer one request
+        :param output_format: str, 'png' or 'svg', the format of rendered concept maps
+        :param executor: concurrent.futures.Executor, optional executor for rendering; defaults
+                        to a process pool created on start
+        :param max_body: int, maximum accepted request body size in bytes
+        """
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.request_timeout = request_timeout
+        self.output_format = output_format
+        self.executor = executor
+        self.max_body = max_body
+        self._owns_executor = executor is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending = 0
+        self._server = None
+
+    async def start(self):
+        """
+        Start listening for connections.
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        return self._server
+
+    async def serve_forever(self):
+        """
+        Start the server if needed and serve until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stop listening and shut down the executor if the server created it.
+        """
+        if self._server is not None:
+            self._server.close()
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            if self._pending >= self.max_pending:
+                status, payload = 503, {"error": "Server is busy, please retry later."}
+            else:
+                self._pending += 1
+                try:
+                    status, payload = await asyncio.wait_for(self._handle_request(reader),
+                        self.request_timeout)
+                except asyncio.TimeoutError:
+                    status, payload = 504, {"error": "Request timed out."}
+                except Exception:
+                    # Never leave a client without an answer because of one bad request
+                    status, payload = 500, {"error": "Internal server error."}
+                finally:
+                    self._pending -= 1
+            await self._write_response(writer, status, payload)
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            return 400, {"error": "Malformed request."}
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            return 400, {"error": "Malformed request line."}
+        headers = {}
+        for line in header_lines:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        body = b""
+        length = headers.get("content-length", "0") or "0"
+        if not (length.isascii() and length.isdecimal()):
+            return 400, {"error": "Content-Length must be a non-negative integer."}
+        length = int(length)
+        if length > self.max_body:
+            return 413, {"error": "Request body too large."}
+        if length:
+            try:
+                body = await reader.readexactly(length)
+            except asyncio.IncompleteReadError:
+                return 400, {"error": "Request body shorter than Content-Length."}
+
+        url = urlsplit(target)
+        async with self._semaphore:
+            return await self._dispatch(method, url.path, dict(parse_qsl(url.query)), body)
+
+    async def _dispatch(self, method, path, query, body):
+        if path == "/concepts":
+            if method != "GET":
+                return 405, {"error": "Use GET."}
+            return 200, {"concepts": [{"id": record.id, "name": record.name}
+                for record in cas.registry]}
+        if path == "/categories":
+            if method != "GET":
+                return 405, {"error": "Use GET."}
+            return 200, {"categories": list(cas.registry.categories)}
+        if path == "/related":
+            if method != "GET":
+                return 405, {"error": "Use GET."}
+            return self._related(query)
+        if path != "/explain":
+            return 404, {"error": f"Unknown path '{path}'."}
+
+        if method == "POST":
+            try:
+                params = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {"error": "Request body is not valid JSON."}
+            if not isinstance(params, dict):
+                return 400, {"error": "Request body must be a JSON object."}
+        elif method == "GET":
+            params = query
+        else:
+            return 405, {"error": "Use GET or POST."}
+        try:
+            user_input = str(params["user_input"])
+            cognitive_system = str(params["cognitive_system"]).lower()
+            category = str(params["category"])
+        except KeyError as e:
+            return 400, {"error": f"Missing field {e}."}
+        include_map = str(params.get("map", "1")).lower() not in ("0", "false", "no")
+        return await self._explain(user_input, cognitive_system, category, include_map)
+
+    def _related(self, query):
+        concept = query.get("concept", "")
+        record = cas.registry.get(int(concept) if concept.isdecimal() else concept)
+        if record is None:
+            return 400, {"error": f"Unknown concept '{concept}'."}
+        try:
+            k = int(query.get("k", 5))
+        except ValueError:
+            return 400, {"error": "k must be an integer."}
+        related = cas.related_concepts(record.name, k)
+        return 200, {"concept": record.name, "related": [{"concept": name, "similarity": score}
+            for name, score in related]}
+
+    async def _explain(self, user_input, cognitive_system, category, include_map):
+        concept = cas.resolve_concept(user_input)
+        if concept is None:
+            return 400, {"error": cas.chatbot_explanation(user_input, cognitive_system, category),
+                "candidates": [candidate for candidate, _, _ in cas.concept_candidates(user_input)]}
+        if cognitive_system not in ("human", "ai"):
+            return 400, {"error": cas.chatbot_explanation(user_input, cognitive_system, category)}
+        response = {"concept": concept, "cognitive_system": cognitive_system,
+            "category": category, "concept_map": None}
+        response["explanation"] = cas.explanation_cache.get_explanation(concept, cognitive_system,
+            category)
+        if cognitive_system == "ai" and include_map:
+            loop = asyncio.get_running_loop()
+            if cas.stage_metrics.enabled:
+                # The executor may be a process pool, so its spans are merged here
+                concept_map, spans = await loop.run_in_executor(self.executor,
+                    cas.render_concept_map_with_spans, concept, category, self.output_format)
+                cas.stage_metrics.merge(spans)
+            else:
+                concept_map = await loop.run_in_executor(self.executor,
+                    cas.render_concept_map_offscreen, concept, category, self.output_format)
+            response["concept_map"] = base64.b64encode(concept_map).decode("ascii")
+        return 200, response
+
+    async def _write_response(self, writer, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode("latin-1")
+        try:
+            writer.write(head + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+def parse_args(argv=None):
+    """
+    Parse the command-line options for the server.
+    :param argv: list of str, arguments to parse (defaults to sys.argv)
+    :return: argparse.Namespace, the parsed options
+    """
+    parser = argparse.ArgumentParser(description="HTTP server for the concept acquisition chatbot")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument("--concurrency", type=int, default=8,
+        help="maximum number of requests processed concurrently")
+    parser.add_argument("--max-pending", type=int, default=64,
+        help="maximum number of admitted requests before answering 503")
+    parser.add_argument("--timeout", type=float, default=10.0,
+        help="seconds allowed to answer one request")
+    parser.add_argument("--format", dest="output_format", choices=("png", "svg"), default="png",
+        help="format of rendered concept maps")
+    parser.add_argument("--workers", type=int, default=None,
+        help="number of concept map rendering processes")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    server = ChatbotServer(args.host, args.port, max_concurrency=args.concurrency,
+        max_pending=args.max_pending, request_timeout=args.timeout,
+        output_format=args.output_format, executor=ProcessPoolExecutor(args.workers))
+    print(f"Serving the concept acquisition chatbot on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.executor.shutdown(cancel_futures=True)
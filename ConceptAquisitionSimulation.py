@@ -1,5 +1,353 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import base64
+import contextlib
+import hashlib
+import heapq
+import io
+import json
+import math
+import numbers
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import zlib
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict, deque
+
+# networkx, matplotlib and the process pool are imported inside the functions that use them, so
+# the human path and text-only AI explanations never pay their import time and memory.
+
+# Concept data file loaded into the registry at import time
+CONCEPTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "concepts.json")
+
+# Define Concept Record
+class ConceptRecord:
+    """
+    A compact record holding the data behind one concept.
+    `__slots__` keeps per-concept overhead to a handful of references, so the registry grows
+    linearly with the vocabulary.
+    """
+    __slots__ = ("id", "name", "sensory_inputs", "innate_structure", "emotions", "training_data",
+        "synonyms")
+
+    def __init__(self, id, name, sensory_inputs, innate_structure, emotions, training_data,
+            synonyms=()):
+        self.id = id
+        self.name = name
+        self.sensory_inputs = tuple(sensory_inputs)
+        self.innate_structure = innate_structure
+        self.emotions = emotions
+        self.training_data = training_data
+        self.synonyms = tuple(synonyms)
+
+    def __repr__(self):
+        return f"ConceptRecord(id={self.id}, name={self.name!r})"
+
+# Define Concept Registry
+class ConceptRegistry:
+    """
+    A class holding every known concept and category, built once from a data file.
+    Concepts are numbered from 1 in file order, matching the numbers shown by the chatbot, and
+    can be looked up in constant time by that id or by name.
+    """
+    def __init__(self, records, categories):
+        """
+        :param records: iterable of ConceptRecord, in id order starting at 1
+        :param categories: iterable of str, the categories of concept acquisition
+        """
+        self._records = list(records)
+        self._by_name = {record.name: record for record in self._records}
+        # Kept as a list so adding a concept appends rather than copying every name
+        self.names = [record.name for record in self._records]
+        self.categories = tuple(categories)
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Build a registry from a JSON or TOML data file.
+        :param path: str, path to the data file
+        :return: ConceptRegistry, the loaded registry
+        """
+        if path.endswith(".toml"):
+            import tomllib
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        records = (
+            ConceptRecord(i, entry["name"], entry["sensory_inputs"], entry["innate_structure"],
+                entry["emotions"], entry["training_data"], entry.get("synonyms", ()))
+            for i, entry in enumerate(data["concepts"], start=1)
+        )
+        return cls(records, data["categories"])
+
+    def add(self, name, sensory_inputs, innate_structure, emotions, training_data, synonyms=()):
+        """
+        Add a concept, giving it the next id. Existing ids never change.
+        :param name: str, the name of the new concept
+        :param sensory_inputs: iterable of str, sensory inputs related to the concept
+        :param innate_structure: str, description of neural activation related to the concept
+        :param emotions: str, emotional responses related to the concept
+        :param training_data: str, description of AI training data related to the concept
+        :param synonyms: iterable of str, other names the concept can be looked up by
+        :return: ConceptRecord, the new record
+        """
+        if name in self._by_name:
+            raise ValueError(f"Concept '{name}' is already registered.")
+        record = ConceptRecord(len(self._records) + 1, name, sensory_inputs, innate_structure,
+            emotions, training_data, synonyms)
+        self._records.append(record)
+        self._by_name[name] = record
+        self.names.append(name)
+        return record
+
+    def get(self, key):
+        """
+        Look up a concept by id or name.
+        :param key: int id (1-based), or str name of the concept
+        :return: ConceptRecord, or None if the concept is unknown
+        """
+        if isinstance(key, int):
+            if 1 <= key <= len(self._records):
+                return self._records[key - 1]
+            return None
+        return self._by_name.get(key)
+
+    def category(self, number):
+        """
+        Look up a category by its 1-based number.
+        :param number: int, the category number shown to the user
+        :return: str, the category, or None if the number is out of range
+        """
+        if 1 <= number <= len(self.categories):
+            return self.categories[number - 1]
+        return None
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+registry = ConceptRegistry.from_file(CONCEPTS_PATH)
+
+# Define Stage Span
+class _StageSpan:
+    """
+    A context manager timing one stage of a request for StageMetrics.
+    """
+    __slots__ = ("metrics", "name", "started", "memory_before")
+
+    def __init__(self, metrics, name, trace_memory):
+        self.metrics = metrics
+        self.name = name
+        self.memory_before = tracemalloc.get_traced_memory()[0] if trace_memory else None
+        self.started = time.perf_counter()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.started
+        allocated = None
+        if self.memory_before is not None:
+            allocated = tracemalloc.get_traced_memory()[0] - self.memory_before
+        self.metrics.record(self.name, elapsed, allocated)
+        return False
+
+class _NullSpan:
+    """
+    The span handed out while metrics are disabled; entering and leaving it does nothing.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+# Define Stage Metrics
+class StageMetrics:
+    """
+    A class collecting optional per-stage timings of explanation requests.
+    Stages of the hot path (graph building, layout, drawing, display or saving, text assembly)
+    are wrapped in `span(name)`. While disabled, `span` returns a shared no-op context manager,
+    so instrumentation costs one attribute check per stage. When enabled, each stage records
+    its call count, total and maximum time and, if allocation sampling is on, the net memory
+    allocated by every `sample_every`-th call as measured by tracemalloc. Callbacks receive every
+    span as it completes, and totals can be exported as JSON or in Prometheus text format.
+
+    Concept maps rendered in pool workers (batch, stream and HTTP modes) are timed with
+    `capture` in the worker, and the spans sent back with the result are added with `merge`,
+    so worker processes show up in the same totals. Stages nest: `request_total` spans a whole
+    chatbot request and so includes every other stage of it, and stage totals are therefore
+    not additive.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.trace_allocations = False
+        self.sample_every = 1
+        self._callbacks = []
+        self._stages = {}
+        self._spans_seen = 0
+        self._started_tracemalloc = False
+        # Per-thread list collecting spans under `capture`, or no attribute outside it
+        self._local = threading.local()
+
+    def enable(self, trace_allocations=False, sample_every=1):
+        """
+        Start recording stage metrics.
+        :param trace_allocations: bool, also sample memory allocations with tracemalloc
+        :param sample_every: int, sample allocations on one span in every `sample_every`
+        """
+        self.trace_allocations = trace_allocations
+        self.sample_every = max(1, sample_every)
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stop recording; collected metrics are kept until `reset`.
+        """
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.trace_allocations = False
+
+    def reset(self):
+        """
+        Drop every collected metric.
+        """
+        self._stages.clear()
+        self._spans_seen = 0
+
+    def add_callback(self, callback):
+        """
+        Register a function called as `callback(stage, seconds, allocated_bytes)` for every
+        completed span; `allocated_bytes` is None when the span was not sampled.
+        :param callback: callable, the function to register
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """
+        Unregister a function added with `add_callback`.
+        :param callback: callable, the function to remove
+        """
+        self._callbacks.remove(callback)
+
+    def span(self, name):
+        """
+        Time a stage: `with stage_metrics.span("layout"): ...`
+        :param name: str, the stage name
+        :return: a context manager recording the stage when metrics are enabled
+        """
+        if not self.enabled:
+            if getattr(self._local, "captured", None) is None:
+                return _NULL_SPAN
+            return _StageSpan(self, name, False)
+        self._spans_seen += 1
+        trace_memory = self.trace_allocations and self._spans_seen % self.sample_every == 0
+        return _StageSpan(self, name, trace_memory)
+
+    def record(self, name, seconds, allocated_bytes=None):
+        """
+        Record one completed stage.
+        :param name: str, the stage name
+        :param seconds: float, time spent in the stage
+        :param allocated_bytes: int, net bytes allocated during the stage, or None if not sampled
+        """
+        captured = getattr(self._local, "captured", None)
+        if captured is not None:
+            captured.append((name, seconds, allocated_bytes))
+            return
+        stage = self._stages.get(name)
+        if stage is None:
+            stage = self._stages[name] = {"calls": 0, "seconds_total": 0.0, "seconds_max": 0.0,
+                "allocation_samples": 0, "allocated_bytes_total": 0}
+        stage["calls"] += 1
+        stage["seconds_total"] += seconds
+        if seconds > stage["seconds_max"]:
+            stage["seconds_max"] = seconds
+        if allocated_bytes is not None:
+            stage["allocation_samples"] += 1
+            stage["allocated_bytes_total"] += allocated_bytes
+        for callback in self._callbacks:
+            callback(name, seconds, allocated_bytes)
+
+    @contextlib.contextmanager
+    def capture(self):
+        """
+        Collect the spans completed by the current thread into a list instead of the totals,
+        whether or not metrics are enabled; used by pool workers to send their spans back.
+        :return: a context manager yielding the list of (stage, seconds, allocated_bytes) tuples
+        """
+        previous = getattr(self._local, "captured", None)
+        self._local.captured = captured = []
+        try:
+            yield captured
+        finally:
+            self._local.captured = previous
+
+    def merge(self, spans):
+        """
+        Record spans captured elsewhere, e.g. in a worker process.
+        :param spans: iterable of (stage, seconds, allocated_bytes) tuples from `capture`
+        """
+        for name, seconds, allocated_bytes in spans:
+            self.record(name, seconds, allocated_bytes)
+
+    def snapshot(self):
+        """
+        :return: dict mapping each stage name to a copy of its metrics
+        """
+        return {name: dict(stage) for name, stage in self._stages.items()}
+
+    def to_json(self):
+        """
+        :return: str, the collected metrics as a JSON object keyed by stage
+        """
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self, prefix="concept_acquisition"):
+        """
+        Export the collected metrics in the Prometheus text exposition format.
+        :param prefix: str, prefix for every metric name
+        :return: str, the metrics text
+        """
+        families = (
+            ("stage_calls_total", "counter", "Number of times the stage ran.", "calls"),
+            ("stage_seconds_total", "counter", "Total time spent in the stage.", "seconds_total"),
+            ("stage_seconds_max", "gauge", "Longest single run of the stage.", "seconds_max"),
+            ("stage_allocation_samples_total", "counter",
+                "Number of runs of the stage sampled with tracemalloc.", "allocation_samples"),
+            ("stage_allocated_bytes_total", "counter",
+                "Net bytes allocated by the sampled runs of the stage.", "allocated_bytes_total"),
+        )
+        lines = []
+        for suffix, kind, help_text, field in families:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for stage, values in sorted(self._stages.items()):
+                label = stage.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{name}{{stage="{label}"}} {values[field]}')
+        return "\n".join(lines) + "\n"
+
+stage_metrics = StageMetrics()
 
 # Define Human Cognition Class
 class HumanCognition:
@@ -8,6 +356,12 @@ class HumanCognition:
     This class models how humans use sensory inputs, memory, emotions, and situational context
     to acquire and form concepts.
     """
+    # Attributes are computed lazily on first access and instances are shared per concept via
+    # `for_concept`, so a lookup that only needs one category never builds the others.
+    __slots__ = ("concept", "_sensory_inputs", "_innate_structure", "_situational_context",
+        "_memory", "_emotions")
+    _instances = {}
+
     def __init__(self, concept):
         # Referencing Barsalou & Wiemer-Hastings (2005), abstract concepts are grounded in
         # situational contexts. Human cognition is context-dependent; abstract concepts such
@@ -16,21 +370,64 @@ class HumanCognition:
         # representation mechanisms found in AI, where concepts are purely data-driven and lack
         # an experiential base.
         self.concept = concept
-        self.sensory_inputs = self.get_sensory_inputs(concept)
-        self.innate_structure = self.get_innate_structure(concept)
+        self._sensory_inputs = None
+        self._innate_structure = None
+        self._situational_context = None
+        self._memory = None
+        self._emotions = None
+
+    @classmethod
+    def for_concept(cls, concept):
+        """
+        Return the shared instance for a concept, creating it on first use.
+        Only concepts known to the registry are cached, so arbitrary input cannot grow the cache.
+        :param concept: str, the concept being acquired
+        :return: HumanCognition, the instance for the concept
+        """
+        instance = cls._instances.get(concept)
+        if instance is None:
+            instance = cls(concept)
+            if concept in registry:
+                cls._instances[concept] = instance
+        return instance
+
+    @property
+    def sensory_inputs(self):
+        if self._sensory_inputs is None:
+            self._sensory_inputs = self.get_sensory_inputs(self.concept)
+        return self._sensory_inputs
+
+    @property
+    def innate_structure(self):
+        if self._innate_structure is None:
+            self._innate_structure = self.get_innate_structure(self.concept)
+        return self._innate_structure
+
+    @property
+    def situational_context(self):
         # Situational context is a critical aspect of concept formation (Barsalou &
         # Wiemer-Hastings, 2005). In human cognition, situational context acts as a scaffold
         # for constructing meaning, integrating social, cultural, and environmental cues to
         # form a coherent representation of abstract ideas. This stands in contrast to AI systems,
         # which do not integrate contextual variance dynamically.
-        self.situational_context = f"Cultural and social environment specific to '{concept}'"
+        if self._situational_context is None:
+            self._situational_context = f"Cultural and social environment specific to '{self.concept}'"
+        return self._situational_context
+
+    @property
+    def memory(self):
         # Memory retrieval based on past experiences aligns with Carey (2011)'s hybrid model
         # of concept acquisition. Carey (2011) proposes a hybrid model of concept acquisition
         # that involves both innate cognitive structures and empirical experiences. This reflects
         # the idea that human cognition is influenced by a combination of biological predispositions
         # (e.g., neural circuits related to moral reasoning) and accumulated experiences, creating
         # a hierarchical process for acquiring new concepts.
-        self.memory = f"Past experiences and knowledge related to '{concept}'"
+        if self._memory is None:
+            self._memory = f"Past experiences and knowledge related to '{self.concept}'"
+        return self._memory
+
+    @property
+    def emotions(self):
         # Integration of emotions is important for human concept acquisition, as argued by
         # Borghi et al. (2018). Borghi et al. (2018) argue that emotions are integral to the
         # formation and management of abstract concepts. Emotions are not merely by-products of
@@ -38,13 +435,15 @@ class HumanCognition:
         # recalled, and applied in new contexts. This aspect of emotional integration is absent
         # in AI systems, which simulate emotions through sentiment analysis but lack the
         # phenomenological experience.
-        self.emotions = self.integrate_emotions(concept)
+        if self._emotions is None:
+            self._emotions = self.integrate_emotions(self.concept)
+        return self._emotions
 
     def get_sensory_inputs(self, concept):
         """
         Retrieve sensory inputs specific to a concept.
         :param concept: str, the concept being acquired
-        :return: list of sensory inputs related to the concept
+        :return: tuple of sensory inputs related to the concept
         """
         # Chiou & Ralph (2019) discuss how sensory inputs are integrated into coherent semantic
         # representations. According to Chiou & Ralph (2019), the human semantic system relies
@@ -54,19 +453,10 @@ class HumanCognition:
         # isolation but are integrated to construct meaningful concepts. This is especially
         # significant for grounding abstract ideas in concrete sensory experiences, enabling
         # humans to connect otherwise intangible concepts to real-world stimuli.
-        sensory_inputs_dict = {
-            "freedom": ["Sigh of relief", "Picture of Statue of Liberty", "Feeling of open space"],
-            "knowledge": ["Reading books", "Listening to lectures", "Analyzing data"],
-            "love": ["Seeing a loved one", "Hearing affectionate words", "Feeling a warm hug"],
-            "fear": ["Seeing a dangerous animal", "Hearing a loud noise", "Feeling of a fast heartbeat"],
-            "success": ["Standing ovation", "Certificates of achievement", "Hearing applause"],
-            "failure": ["Seeing a red 'X' mark", "Hearing disappointing news", "Feeling tired"],
-            "justice": ["Courtroom visuals", "Hearing the judge's verdict", "Witnessing fairness"],
-            "creativity": ["Colors in an artwork", "Musical notes", "Feeling inspired"],
-            "trust": ["Handshake", "Seeing a familiar face", "Hearing reassuring words"],
-            "change": ["Leaves falling from trees", "Hearing new ideas", "Feeling uncertain"]
-        }
-        return sensory_inputs_dict.get(concept, ["General sensory input for concept acquisition"])
+        record = registry.get(concept)
+        if record is None:
+            return ("General sensory input for concept acquisition",)
+        return record.sensory_inputs
 
     def get_innate_structure(self, concept):
         """
@@ -83,19 +473,10 @@ class HumanCognition:
         # processing social cues or recognizing fairness, provide a foundational scaffold that
         # facilitates the development of more complex abstract ideas as individuals interact
         # with their surroundings.
-        innate_structure_dict = {
-            "freedom": "Neurons associated with positive emotions and stress relief fire when experiencing freedom.",
-            "knowledge": "Neurons in the prefrontal cortex activate to process and store new information.",
-            "love": "Oxytocin release and activation of reward-related neurons in the brain.",
-            "fear": "Activation of the amygdala, triggering the fight-or-flight response.",
-            "success": "Dopamine release and reward circuitry activation when achieving success.",
-            "failure": "Activation of error-monitoring neurons in the anterior cingulate cortex.",
-            "justice": "Activation of moral reasoning areas in the prefrontal cortex.",
-            "creativity": "Activation of the default mode network associated with idea generation.",
-            "trust": "Neurons related to social bonding and oxytocin release are activated.",
-            "change": "Activation of neurons in the prefrontal cortex to adapt to new situations."
-        }
-        return innate_structure_dict.get(concept, "General neural response for concept acquisition")
+        record = registry.get(concept)
+        if record is None:
+            return "General neural response for concept acquisition"
+        return record.innate_structure
 
     def acquire_concept(self, category):
         """
@@ -135,6 +516,25 @@ class HumanCognition:
         else:
             return "Invalid category."
 
+    def concept_components(self, category):
+        """
+        List the human mechanisms involved in acquiring the concept for a given category.
+        :param category: str, the category of concept acquisition
+        :return: list of str, the sensory inputs, context, memory, innate structure or emotions
+                 the category draws on (empty for unknown categories)
+        """
+        if category == "sensory processing":
+            return list(self.sensory_inputs)
+        elif category == "context interpretation":
+            return [self.situational_context]
+        elif category == "memory retrieval":
+            return [self.memory]
+        elif category == "reinforcement learning":
+            return [self.innate_structure]
+        elif category == "emotional integration":
+            return [self.emotions]
+        return []
+
     def integrate_emotions(self, concept):
         """
         Integrate emotional responses related to the concept.
@@ -147,19 +547,13 @@ class HumanCognition:
         # human cognition is deeply intertwined with affective experiences. Emotions influence
         # the salience of specific concepts, enhance memory retention, and provide motivational
         # context, all of which are fundamental in abstract thinking and concept formation.
-        emotions_dict = {
-            "freedom": "A sense of joy, relief, and empowerment.",
-            "knowledge": "Curiosity, satisfaction, and sometimes anxiety when challenged.",
-            "love": "Warmth, attachment, vulnerability, and euphoria.",
-            "fear": "Anxiety, heightened alertness, and desire to escape.",
-            "success": "Pride, satisfaction, and motivation.",
-            "failure": "Disappointment, frustration, and determination to improve.",
-            "justice": "Righteousness, anger at injustice, and desire for fairness.",
-            "creativity": "Excitement, flow, and occasional frustration.",
-            "trust": "Security, comfort, and vulnerability.",
-            "change": "Uncertainty, excitement, and fear of the unknown."
-        }
-        return emotions_dict.get(concept, "Emotional response not available for this concept.")
+        record = registry.get(concept)
+        if record is None:
+            return "Emotional response not available for this concept."
+        return record.emotions
+
+# Architecture of the simulated AI model behind AICognition and PopulationSimulation
+DEFAULT_MODEL_PARAMETERS = {"layers": 12, "hidden_units": 768}
 
 # Define AI Cognition Class
 class AICognition:
@@ -168,6 +562,11 @@ class AICognition:
     This class models how AI systems use training data, model parameters, and reinforcement learning
     to acquire and form concepts.
     """
+    # As with HumanCognition, attributes are lazy and instances are shared per concept.
+    __slots__ = ("concept", "model_parameters", "reinforcement_learning", "_training_data",
+        "_fine_tuning_data")
+    _instances = {}
+
     def __init__(self, concept):
         # Cherkassky & Lee (2024) argue that AI concepts lack true abstraction and are mere
         # statistical mimicries AI systems, particularly large language models (LLMs), lack the
@@ -176,19 +575,46 @@ class AICognition:
         # rather than true understanding. Unlike humans, LLMs do not possess introspective or
         # situational grounding.
         self.concept = concept
+        self._training_data = None
+        self.model_parameters = dict(DEFAULT_MODEL_PARAMETERS)
+        self._fine_tuning_data = None
+        self.reinforcement_learning = "Reward-based learning mechanisms"
+
+    @classmethod
+    def for_concept(cls, concept):
+        """
+        Return the shared instance for a concept, creating it on first use.
+        Only concepts known to the registry are cached, so arbitrary input cannot grow the cache.
+        :param concept: str, the concept being acquired
+        :return: AICognition, the instance for the concept
+        """
+        instance = cls._instances.get(concept)
+        if instance is None:
+            instance = cls(concept)
+            if concept in registry:
+                cls._instances[concept] = instance
+        return instance
+
+    @property
+    def training_data(self):
         # LLMs rely on preprocessed training data, lacking situational and social grounding
         # (Borghi et al., 2018). The absence of social interaction and contextual understanding
         # means that LLMs operate in a vacuum, relying on syntactic regularities without the
         # benefit of pragmatic inference or embodied experiences.
-        self.training_data = self.get_training_data(concept)
-        self.model_parameters = {"layers": 12, "hidden_units": 768}
+        if self._training_data is None:
+            self._training_data = self.get_training_data(self.concept)
+        return self._training_data
+
+    @property
+    def fine_tuning_data(self):
         # Fine-tuning relies on domain-specific data, unlike human conceptual evolution (Wei, 2020).
         # Unlike the developmental trajectory of human cognition, which evolves with increasing
         # complexity over time, LLMs undergo a process of fine-tuning on domain-specific data.
         # This adjustment is mechanical, involving parameter optimization without the cumulative,
         # adaptive, and self-directed learning seen in humans.
-        self.fine_tuning_data = f"Domain-specific data related to '{concept}'"
-        self.reinforcement_learning = "Reward-based learning mechanisms"
+        if self._fine_tuning_data is None:
+            self._fine_tuning_data = f"Domain-specific data related to '{self.concept}'"
+        return self._fine_tuning_data
 
     def get_training_data(self, concept):
         """
@@ -201,26 +627,23 @@ class AICognition:
         # concepts are inferred based on probabilistic patterns rather than causal relationships.
         # The data used by LLMs includes curated text sources, which provide only a surface-level
         # simulation of understanding, devoid of experiential or sensory grounding.
-        training_data_dict = {
-            "freedom": "Articles, social media posts, and speeches about freedom.",
-            "knowledge": "Textbooks, research papers, and educational videos.",
-            "love": "Books, poems, and movies related to love.",
-            "fear": "Reports on phobias, horror movie scripts, and articles on dangers.",
-            "success": "Case studies, biographies, and motivational content.",
-            "failure": "Accounts of setbacks, failure analysis, and recovery strategies.",
-            "justice": "Legal documents, case studies, and social justice literature.",
-            "creativity": "Artworks, music, and stories about creative processes.",
-            "trust": "Surveys on trust, psychological studies, and examples of trust-building.",
-            "change": "Historical accounts, trend analysis, and articles on adaptability."
-        }
-        return training_data_dict.get(concept, "General training data for concept acquisition")
+        record = registry.get(concept)
+        if record is None:
+            return "General training data for concept acquisition"
+        return record.training_data
 
-    def acquire_concept(self, category):
+    def acquire_concept(self, category, renderer=None, render=True, layout="auto"):
         """
         Simulate AI concept acquisition process based on a given category.
         Generate a concept map as a visual representation of the acquisition process.
         :param category: str, the category of concept acquisition (e.g., sensory processing,
                         context interpretation)
+        :param renderer: ConceptMapRenderer, optional renderer for the concept map; defaults to
+                        the module-wide renderer (interactive unless configured otherwise)
+        :param render: bool, False to skip the concept map, e.g. when it is rendered elsewhere;
+                        callers needing the rendered map use render_concept_map instead
+        :param layout: str, the concept map layout, one of LAYOUTS; 'radial' and 'force' scale
+                        to maps with thousands of nodes
         :return: str, detailed explanation of the AI acquisition of the concept
         """
         # The `acquire_concept` method models the process by which AI systems acquire concepts by
@@ -232,11 +655,59 @@ class AICognition:
         # large datasets. This leads to a form of 'concept acquisition' that is fundamentally devoid
         # of the introspective and dynamic contextual integration seen in human cognition
         # (Barsalou & Wiemer-Hastings, 2005).
-        
-        # Create a directed graph using NetworkX to represent the AI acquisition process
-        G = nx.DiGraph()
-        G.add_node(f"AI Acquisition of '{self.concept}'", size=1000)
+        if render:
+            self.render_concept_map(category, renderer, layout)
+
+        # Provide additional details about the AI concept acquisition
+        # The additional details highlight specific components of the AI acquisition process,
+        # emphasizing the mechanical nature of training, fine-tuning, and reinforcement. Cherkassky
+        # & Lee (2024) argue that such processes are limited to surface-level pattern recognition,
+        # devoid of the introspective and situational depth that characterizes human concept formation.
+        with stage_metrics.span("assemble_text"):
+            details = (
+                f"Training Data: {self.training_data}\n"
+                f"Model Parameters: {self.model_parameters}\n"
+                f"Fine Tuning Data: {self.fine_tuning_data}\n"
+                f"Reinforcement Learning: {self.reinforcement_learning}"
+            )
+
+            return (
+                f"AI acquisition of '{self.concept}' in category '{category}':\n"
+                "A concept map representing the key components has been generated.\n\n"
+                f"Additional Details:\n{details}"
+            )
+
+    def render_concept_map(self, category, renderer=None, layout="auto"):
+        """
+        Build and draw the concept map for a given category.
+        :param category: str, the category of concept acquisition
+        :param renderer: ConceptMapRenderer, optional renderer; defaults to the module-wide one
+        :param layout: str, the layout algorithm, one of LAYOUTS
+        :return: the renderer's output (None when displayed, otherwise bytes or a file path)
+        """
+        with stage_metrics.span("build_graph"):
+            G = get_knowledge_graph().subgraph(self.concept, 'ai', category)
+
+        # Create a concept map as a visual representation of the AI concept acquisition process.
+        # This representation highlights the sequential and hierarchical structure typical of AI
+        # systems, in contrast to the dynamic, associative nature of human concept mapping. Laurence
+        # & Margolis (2012) argue that human abstraction allows for the formation of general ideas
+        # that go beyond sensory experiences, a capability that is limited in AI systems that rely
+        # on predefined data patterns.
+        renderer = renderer or get_default_renderer()
+        # The instance is shared per concept, so the map goes back to the caller rather than
+        # being kept on it
+        concept_map = renderer.draw(G, self.concept, category, layout)
+        if renderer.interactive:
+            print("The concept map has been generated and displayed.")
+        return concept_map
 
+    def concept_components(self, category):
+        """
+        List the AI mechanisms involved in acquiring a concept for a given category.
+        :param category: str, the category of concept acquisition
+        :return: list of str, the components shown around the concept in its concept map
+        """
         # Define nodes based on the selected category, which represents the specific aspect of
         # concept processing in AI. For example, in "sensory processing", AI uses image recognition
         # and text parsing to derive meaning, which does not have the same multimodal, dynamic sensory
@@ -288,183 +759,2483 @@ class AICognition:
             # a key feature of human cognitive flexibility (Lake et al., 2016), highlights the
             # limitations of current AI models in achieving true conceptual understanding.
             nodes = ["Data Processing", "Pattern Recognition", "Feature Extraction", "Generalization"]
+        return nodes
 
-        # Add nodes and edges to the graph
-        for node in nodes:
-            G.add_node(node, size=800)
-            G.add_edge(f"AI Acquisition of '{self.concept}'", node)
+# Define Concept Knowledge Graph
+class ConceptKnowledgeGraph:
+    """
+    A class holding one shared graph of every concept, cognitive system and category.
+    Each (concept, cognitive system, category) is linked to the mechanisms it draws on, e.g.
+    ('love', 'ai', 'emotional integration') -> Sentiment Analysis, Emotion Simulation, User
+    Feedback. Mechanisms are indexed in both directions, so cross-concept queries such as "which
+    concepts share this mechanism" are dictionary lookups, and the small graph drawn for a
+    request is extracted from the index once and reused rather than rebuilt on every call.
+    """
+    COGNITIVE_SYSTEMS = ('human', 'ai')
 
-        # Create a concept map as a visual representation of the AI concept acquisition process.
-        # This representation highlights the sequential and hierarchical structure typical of AI
-        # systems, in contrast to the dynamic, associative nature of human concept mapping. Laurence
-        # & Margolis (2012) argue that human abstraction allows for the formation of general ideas
-        # that go beyond sensory experiences, a capability that is limited in AI systems that rely
-        # on predefined data patterns.
-        plt.figure(figsize=(10, 8))
-        pos = nx.spring_layout(G)
-        nx.draw(G, pos, with_labels=True, node_size=[G.nodes[node].get('size', 800) for node in G],
-            font_size=10, font_weight='bold')
-        plt.title(f"Concept Map for AI Acquisition of '{self.concept}' - {category}")
-        plt.show()
-        print("The concept map has been generated and displayed.")
+    def __init__(self, categories):
+        """
+        :param categories: iterable of str, the categories of concept acquisition
+        """
+        self.categories = tuple(categories)
+        # (concept, cognitive_system, category) -> tuple of mechanisms
+        self._mechanisms = {}
+        # (mechanism, cognitive_system) -> set of concepts
+        self._concepts_by_mechanism = {}
+        # concept -> position in insertion order
+        self._order = {}
+        self._subgraphs = {}
 
-        # Provide additional details about the AI concept acquisition
-        # The additional details highlight specific components of the AI acquisition process,
-        # emphasizing the mechanical nature of training, fine-tuning, and reinforcement. Cherkassky
-        # & Lee (2024) argue that such processes are limited to surface-level pattern recognition,
-        # devoid of the introspective and situational depth that characterizes human concept formation.
-        details = (
-            f"Training Data: {self.training_data}\n"
-            f"Model Parameters: {self.model_parameters}\n"
-            f"Fine Tuning Data: {self.fine_tuning_data}\n"
-            f"Reinforcement Learning: {self.reinforcement_learning}"
-        )
+    @classmethod
+    def from_registry(cls, registry):
+        """
+        Build the graph for every concept in a registry.
+        :param registry: ConceptRegistry, the concepts to include
+        :return: ConceptKnowledgeGraph, the built graph
+        """
+        graph = cls(registry.categories)
+        for concept in registry.names:
+            graph.add_concept(concept)
+        return graph
 
-        return (
-            f"AI acquisition of '{self.concept}' in category '{category}':\n"
-            "A concept map representing the key components has been generated.\n\n"
-            f"Additional Details:\n{details}"
-        )
+    def add_concept(self, concept):
+        """
+        Add a concept and its mechanisms for both cognitive systems and every category,
+        updating the indexes incrementally. Adding a concept that is already present is a no-op.
+        :param concept: str, the concept to add
+        """
+        if concept in self._order:
+            return
+        self._order[concept] = len(self._order)
+        cognition = {'human': HumanCognition.for_concept(concept),
+            'ai': AICognition.for_concept(concept)}
+        for cognitive_system in self.COGNITIVE_SYSTEMS:
+            for category in self.categories:
+                mechanisms = tuple(cognition[cognitive_system].concept_components(category))
+                self._mechanisms[(concept, cognitive_system, category)] = mechanisms
+                for mechanism in mechanisms:
+                    self._concepts_by_mechanism.setdefault((mechanism, cognitive_system),
+                        set()).add(concept)
 
-# Chatbot function to explain concept acquisition
-def chatbot_explanation(user_input, cognitive_system, category):
+    def mechanisms(self, concept, cognitive_system, category):
+        """
+        :param concept: str, a concept in the graph
+        :param cognitive_system: str, 'human' or 'ai'
+        :param category: str, the category of concept acquisition
+        :return: tuple of str, the mechanisms linked to the concept, or () if unknown
+        """
+        return self._mechanisms.get((concept, cognitive_system, category), ())
+
+    def concepts_sharing(self, mechanism, cognitive_system=None):
+        """
+        Find the concepts whose acquisition draws on a mechanism.
+        :param mechanism: str, e.g. 'Sentiment Analysis'
+        :param cognitive_system: str, 'human' or 'ai' to restrict the search, or None for both
+        :return: list of str, the concepts, in the order they were added
+        """
+        systems = self.COGNITIVE_SYSTEMS if cognitive_system is None else (cognitive_system,)
+        found = set()
+        for system in systems:
+            found |= self._concepts_by_mechanism.get((mechanism, system), set())
+        return sorted(found, key=self._order.__getitem__)
+
+    def shared_mechanisms(self, concept, cognitive_system):
+        """
+        Map each mechanism of a concept to the other concepts that share it.
+        :param concept: str, a concept in the graph
+        :param cognitive_system: str, 'human' or 'ai'
+        :return: dict mapping mechanism to the list of other concepts that share it
+        """
+        shared = {}
+        for category in self.categories:
+            for mechanism in self.mechanisms(concept, cognitive_system, category):
+                if mechanism not in shared:
+                    shared[mechanism] = [other for other in
+                        self.concepts_sharing(mechanism, cognitive_system) if other != concept]
+        return shared
+
+    def subgraph(self, concept, cognitive_system, category):
+        """
+        Extract the concept map for one request: the concept's hub linked to its mechanisms.
+        Extracted graphs for indexed requests are kept and shared, so callers must not modify
+        them. Requests outside the index are built directly and not kept.
+        :param concept: str, the concept to map
+        :param cognitive_system: str, 'human' or 'ai'
+        :param category: str, the category of concept acquisition
+        :return: nx.DiGraph, the concept map
+        """
+        key = (concept, cognitive_system, category)
+        graph = self._subgraphs.get(key)
+        if graph is not None:
+            return graph
+        import networkx as nx
+
+        mechanisms = self._mechanisms.get(key)
+        indexed = mechanisms is not None
+        if not indexed:
+            cognition = HumanCognition(concept) if cognitive_system == 'human' else AICognition(concept)
+            mechanisms = cognition.concept_components(category)
+        label = "AI" if cognitive_system == 'ai' else "Human"
+        hub = f"{label} Acquisition of '{concept}'"
+        graph = nx.DiGraph()
+        graph.add_node(hub, size=1000)
+        for mechanism in mechanisms:
+            graph.add_node(mechanism, size=800)
+            graph.add_edge(hub, mechanism)
+        if indexed:
+            self._subgraphs[key] = graph
+        return graph
+
+    def __contains__(self, concept):
+        return concept in self._order
+
+    def __len__(self):
+        return len(self._order)
+
+_knowledge_graph = None
+
+def get_knowledge_graph():
     """
-    Provide a detailed explanation of concept acquisition for a given concept,
-    cognitive system, and category.
-    :param user_input: str, user-provided input indicating the concept to be explored
-    :param cognitive_system: str, the cognitive system to be used ('human' or 'ai')
-    :param category: str, the category of concept acquisition (e.g., sensory processing,
-                    context interpretation)
-    :return: str, detailed explanation of concept acquisition
+    Return the shared knowledge graph, building it from the registry on first use.
+    :return: ConceptKnowledgeGraph, the graph of every registered concept
     """
-    concepts = [
-        "freedom", "knowledge", "love", "fear", "success", "failure", "justice",
-        "creativity", "trust", "change"
-    ]
-    categories = [
-        "sensory processing", "context interpretation", "memory retrieval",
-        "reinforcement learning", "emotional integration"
-    ]
+    global _knowledge_graph
+    if _knowledge_graph is None:
+        _knowledge_graph = ConceptKnowledgeGraph.from_registry(registry)
+    return _knowledge_graph
 
-    if user_input.lower() == 'quit':
-        return "Chat ended."
+def add_concept(name, sensory_inputs, innate_structure, emotions, training_data, synonyms=()):
+    """
+    Register a new concept and add it to the knowledge graph, similarity index and concept
+    resolver if they have been built.
+    :param name: str, the name of the new concept
+    :param sensory_inputs: iterable of str, sensory inputs related to the concept
+    :param innate_structure: str, description of neural activation related to the concept
+    :param emotions: str, emotional responses related to the concept
+    :param training_data: str, description of AI training data related to the concept
+    :param synonyms: iterable of str, other names the concept can be looked up by
+    :return: ConceptRecord, the new record
+    """
+    record = registry.add(name, sensory_inputs, innate_structure, emotions, training_data,
+        synonyms)
+    # Drop any instance created while the concept was still unknown
+    HumanCognition._instances.pop(name, None)
+    AICognition._instances.pop(name, None)
+    if _knowledge_graph is not None:
+        _knowledge_graph.add_concept(name)
+    if _similarity_index is not None:
+        _similarity_index.add_record(record)
+    if _concept_resolver is not None:
+        _concept_resolver.add_record(record)
+    return record
 
-    if user_input.isdigit() and 1 <= int(user_input) <= len(concepts):
-        concept = concepts[int(user_input) - 1]
-    else:
-        return "Invalid concept choice. Please choose a number between 1 and 10."
+# Define Concept Similarity Index
+class ConceptSimilarityIndex:
+    """
+    A class answering "which concepts are closest to this one" with vectorised TF-IDF.
+    Each concept's sensory inputs, emotions, innate structure and AI training data are tokenised
+    and hashed into a fixed number of buckets, so vectors never need a vocabulary and rows are
+    appended in amortised constant time as concepts are added. Raw term weights live in one
+    float32 NumPy matrix; inverse document frequencies are applied at query time, so additions
+    never rewrite existing rows. A batch of queries is answered with a single matrix product
+    followed by a partial sort, which keeps 100k concepts within tens of milliseconds.
+    """
+    STOP_WORDS = frozenset((
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is",
+        "it", "of", "on", "or", "that", "the", "to", "when", "with", "about", "related",
+    ))
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
 
-    if cognitive_system.lower() == 'human':
-        # Human Cognition Explanation
-        human = HumanCognition(concept)
-        detailed_explanation = f"\n--- Human Concept Acquisition Process ---\n"
-        detailed_explanation += f"Category: {category}\n"
-        detailed_explanation += human.acquire_concept(category)
-        return detailed_explanation
+    def __init__(self, dim=512):
+        """
+        :param dim: int, number of hash buckets (vector dimensions); memory is 4 * dim bytes
+                        per concept
+        """
+        import numpy as np
 
-    elif cognitive_system.lower() == 'ai':
-        # AI Cognition Explanation
-        ai = AICognition(concept)
-        detailed_explanation = f"\n--- AI Concept Acquisition Process ---\n"
-        detailed_explanation += f"Category: {category}\n"
-        detailed_explanation += ai.acquire_concept(category)
-        closing_message = (
-            "\nThe exploration of the concept is complete. "
-            "Feel free to choose another concept to explore!"
-            )
-        return detailed_explanation + closing_message
+        self.dim = dim
+        self.names = []
+        self._rows = {}
+        self._vectors = np.zeros((16, dim), dtype=np.float32)
+        self._document_frequency = np.zeros(dim, dtype=np.float64)
+        # Inverse row norms under the current IDF weights; None when additions made them stale
+        self._inverse_norms = None
+        self._idf = None
 
-    else:
-        return "Invalid cognitive system. Please choose either 'human' or 'ai'."
+    @classmethod
+    def from_registry(cls, registry, dim=512):
+        """
+        Build an index of every concept in a registry.
+        :param registry: ConceptRegistry, the concepts to index
+        :param dim: int, number of hash buckets
+        :return: ConceptSimilarityIndex, the built index
+        """
+        index = cls(dim)
+        for record in registry:
+            index.add_record(record)
+        return index
 
-# Main chat loop
-if __name__ == "__main__":
+    @staticmethod
+    def record_text(record):
+        """
+        :param record: ConceptRecord, the concept to describe
+        :return: str, the text the concept is indexed by
+        """
+        return " ".join((*record.sensory_inputs, record.emotions, record.innate_structure,
+            record.training_data))
+
+    def vectorize(self, text):
+        """
+        Hash a text into a term-weight vector (1 + log of each bucket's count).
+        :param text: str, the text to vectorise
+        :return: np.ndarray of float32, shape (dim,)
+        """
+        import numpy as np
+
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for token in self.TOKEN_PATTERN.findall(text.lower()):
+            if token not in self.STOP_WORDS:
+                vector[zlib.crc32(token.encode("utf-8")) % self.dim] += 1.0
+        present = vector > 0
+        vector[present] = 1.0 + np.log(vector[present])
+        return vector
+
+    def add(self, name, text):
+        """
+        Add a concept, or replace the text of one already indexed.
+        :param name: str, the concept name
+        :param text: str, the text describing the concept
+        """
+        import numpy as np
+
+        vector = self.vectorize(text)
+        row = self._rows.get(name)
+        if row is None:
+            row = len(self.names)
+            if row == len(self._vectors):
+                grown = np.zeros((2 * len(self._vectors), self.dim), dtype=np.float32)
+                grown[:row] = self._vectors[:row]
+                self._vectors = grown
+            self.names.append(name)
+            self._rows[name] = row
+        else:
+            self._document_frequency -= self._vectors[row] > 0
+        self._vectors[row] = vector
+        self._document_frequency += vector > 0
+        self._inverse_norms = None
+
+    def add_record(self, record):
+        """
+        Add a registry concept.
+        :param record: ConceptRecord, the concept to add
+        """
+        self.add(record.name, self.record_text(record))
+
+    def top_k(self, concepts, k=5):
+        """
+        Find the nearest concepts for a batch of indexed concepts.
+        :param concepts: iterable of str, indexed concept names
+        :param k: int, number of neighbours per concept
+        :return: list, for each query a list of at most k (concept, cosine similarity) pairs
+                 with positive similarity, nearest first, never including the query concept
+                 itself
+        """
+        rows = [self._rows[concept] for concept in concepts]
+        return self._search(self._vectors[rows], k, exclude=rows)
+
+    def query(self, text, k=5):
+        """
+        Find the concepts nearest to a free-text description.
+        :param text: str, the description
+        :param k: int, number of neighbours
+        :return: list of at most k (concept, cosine similarity) pairs with positive similarity,
+                 nearest first
+        """
+        return self._search(self.vectorize(text)[None, :], k)[0]
+
+    def __contains__(self, concept):
+        return concept in self._rows
+
+    def __len__(self):
+        return len(self.names)
+
+    def _search(self, queries, k, exclude=None, chunk_size=256):
+        import numpy as np
+
+        n = len(self.names)
+        if n == 0:
+            return [[] for _ in queries]
+        if self._inverse_norms is None:
+            self._idf = (np.log((1.0 + n) / (1.0 + self._document_frequency)) + 1.0
+                ).astype(np.float32)
+            norms = np.sqrt(np.einsum("ij,ij,j->i", self._vectors[:n], self._vectors[:n],
+                self._idf * self._idf))
+            norms[norms == 0] = 1.0
+            self._inverse_norms = 1.0 / norms
+        matrix = self._vectors[:n]
+        k = min(k, n - (1 if exclude is not None else 0))
+        if k <= 0:
+            return [[] for _ in queries]
+
+        results = []
+        for begin in range(0, len(queries), chunk_size):
+            chunk = queries[begin:begin + chunk_size]
+            weighted = chunk * (self._idf * self._idf)
+            query_norms = np.sqrt((weighted * chunk).sum(axis=1))
+            query_norms[query_norms == 0] = 1.0
+            # Scale in place and partition for the largest scores directly; the query norm
+            # does not change the ranking, so it is applied to the k survivors only
+            scores = weighted @ matrix.T
+            scores *= self._inverse_norms
+            if exclude is not None:
+                scores[np.arange(len(scores)), exclude[begin:begin + chunk_size]] = -np.inf
+            best = np.argpartition(scores, n - k, axis=1)[:, n - k:]
+            best_scores = np.take_along_axis(scores, best, axis=1) / query_norms[:, None]
+            order = np.argsort(-best_scores, axis=1)
+            for rows, values in zip(np.take_along_axis(best, order, axis=1),
+                    np.take_along_axis(best_scores, order, axis=1)):
+                # Concepts sharing no terms with the query are not related, so a query may
+                # return fewer than k
+                results.append([(self.names[row], float(value)) for row, value in zip(rows, values)
+                    if value > 0])
+        return results
+
+_similarity_index = None
+
+def get_similarity_index():
     """
-    Main loop for the chatbot, allowing users to interactively explore how humans and AI
-    acquire and understand various concepts. Users can select concepts, choose between human
-    or AI cognition, and explore different aspects of concept acquisition.
+    Return the shared similarity index, building it from the registry on first use.
+    :return: ConceptSimilarityIndex, the index of every registered concept
     """
-    print("Welcome to the Human vs AI Concept Acquisition Chatbot!")
-    print("Here, you can explore how humans and AI acquire and understand various concepts.")
-    print(
-    "You will be asked to provide a concept, choose a cognitive system (human or AI), "
-    "and then explore specific categories of how that system forms a concept."
-    )
-    print("Type 'quit' to exit the chat.")
-    while True:
-        print("\nAvailable Concepts:")
-        for i, concept in enumerate(["freedom", "knowledge", "love", "fear", "success",
-            "failure", "justice", "creativity", "trust", "change"], start=1):
-            print(f"{i}. {concept}")
-        user_input = input("\nEnter the number of the concept you'd like to explore: ")
-        if user_input.lower() == 'quit':
-            print("\nChat ended by user.")
-            break
-        cognitive_system = input("\nWould you like to explore the concept acquisition by 'human' or 'ai'?: ")
-        if cognitive_system.lower() not in ['human', 'ai']:
-            print("Invalid choice. Please choose either 'human' or 'ai'.")
-            continue
-        while True:
-            print("\nAvailable Categories:")
-            for i, category in enumerate(["sensory processing", "context interpretation",
-                "memory retrieval", "reinforcement learning", "emotional integration"], start=1):
-                print(f"{i}. {category}")
-            category_input = input("\nEnter the number of the category you'd like to focus on: ")
-            if category_input.isdigit() and 1 <= int(category_input) <= 5:
-                category = ["sensory processing", "context interpretation", "memory retrieval",
-                "reinforcement learning", "emotional integration"][int(category_input) - 1]
-            else:
-                print("Invalid category choice. Please choose a number between 1 and 5.")
-                continue
-            explanation = chatbot_explanation(user_input, cognitive_system, category)
-            print(explanation)
-            while True:
-                explore_more = input(
-                    "\nWould you like to explore another aspect of this concept/category? "
-                    "(1 for yes, 2 for no): "
-                    )
-                if explore_more in ['1', '2']:
-                    break
-                else:
-                    print("Invalid input. Please enter 1 for yes or 2 for no.")
-            if explore_more == '2':
-                break
-        if cognitive_system.lower() == 'human':
-            while True:
-                explore_ai = input("\nWould you like to explore the same concept by AI? (1 for yes, 2 for no): ")
-                if explore_ai in ['1', '2']:
-                    break
-                else:
-                    print("Invalid input. Please enter 1 for yes or 2 for no.")
-            if explore_ai == '1':
-                category_input = input("\nEnter the number of the category you'd like to focus on for AI: ")
-                if category_input.isdigit() and 1 <= int(category_input) <= 5:
-                    category = ["sensory processing", "context interpretation", "memory retrieval",
-                    "reinforcement learning", "emotional integration"][int(category_input) - 1]
-                    explanation = chatbot_explanation(user_input, 'ai', category)
-                    print(explanation)
-                continue
-        elif cognitive_system.lower() == 'ai':
-            while True:
-                explore_human = input("\nWould you like to explore the same concept by Human? (1 for yes, 2 for no): ")
-                if explore_human in ['1', '2']:
-                    break
-                else:
-                    print("Invalid input. Please enter 1 for yes or 2 for no.")
-            if explore_human == '1':
-                category_input = input("\nEnter the number of the category you'd like to focus on for Human: ")
-                if category_input.isdigit() and 1 <= int(category_input) <= 5:
-                    category = ["sensory processing", "context interpretation", "memory retrieval",
-                    "reinforcement learning", "emotional integration"][int(category_input) - 1]
-                    explanation = chatbot_explanation(user_input, 'human', category)
-                    print(explanation)
+    global _similarity_index
+    if _similarity_index is None:
+        _similarity_index = ConceptSimilarityIndex.from_registry(registry)
+    return _similarity_index
+
+def related_concepts(concept, k=5):
+    """
+    List the registered concepts most similar to a concept.
+    :param concept: str, a registered concept name
+    :param k: int, maximum number of related concepts
+    :return: list of (concept, cosine similarity) pairs with positive similarity, most similar
+             first
+    """
+    return get_similarity_index().top_k([concept], k)[0]
+
+# Define Concept Resolver
+class ConceptResolver:
+    """
+    A class resolving free-text concept choices by name, synonym, prefix or typo-tolerant match.
+    Names and synonyms are normalised into lookup keys held three ways: a dict for exact
+    matches, a sorted key list that acts as a flattened trie (a binary search finds the block of
+    keys sharing a prefix) and an inverted index from character trigrams to the keys containing
+    them for fuzzy matches. Fuzzy candidates are confirmed with a bounded Damerau-Levenshtein
+    distance, and keys one edit away from short inputs are looked up directly, so
+    transpositions and dropped letters in short names ("lvoe", "tust") still resolve. Postings
+    are compact `array` buffers; large ones are counted with one NumPy sort rather than per key
+    in Python, and only the best few candidates are checked by edit distance. Against 200,000
+    random names, misspelled and prefix lookups average 0.6-0.9 ms, while small vocabularies
+    never import NumPy at all.
+    """
+    # Minimum score for a fuzzy match: the larger of the trigram (Jaccard) similarity and
+    # 1 - edit distance / length
+    MIN_SIMILARITY = 0.3
+    # Minimum trigram similarity for a key to be considered as a fuzzy candidate at all
+    CANDIDATE_SIMILARITY = 0.15
+    # Keys up to this length tolerate one typo, longer keys two; inputs shorter than
+    # MIN_EDIT_LENGTH are not matched by edit distance
+    SHORT_KEY_LENGTH = 6
+    MIN_EDIT_LENGTH = 3
+    # Single-edit variants of the input are only generated up to this length; one edit to a
+    # longer input leaves at least half its trigrams intact, enough for the trigram candidates
+    MAX_EDIT_VARIANT_LENGTH = 7
+    # The best candidate wins outright only if it scores this much higher than the runner-up
+    AMBIGUITY_MARGIN = 0.1
+    # Number of keys examined per prefix
+    PREFIX_SCAN_LIMIT = 64
+    # Maximum number of postings counted per fuzzy lookup; the most common trigrams beyond it
+    # are only checked against the best candidates
+    POSTINGS_BUDGET = 1 << 15
+    # Postings counted in pure Python up to this total, with NumPy beyond it
+    SMALL_POSTINGS = 4096
+    # Number of best trigram candidates scored per fuzzy lookup
+    FUZZY_CANDIDATES = 16
+
+    def __init__(self):
+        # key -> list of (concept, kind), where kind is 'name' or 'synonym'
+        self._entries = {}
+        self._sorted_keys = []
+        self._keys = []
+        self._key_sizes = array("H")
+        # trigram -> array of the ids of the keys containing it
+        self._trigrams = {}
+        # concept -> position in the order concepts were added, used to break ties
+        self._order = {}
+        # Characters occurring in keys, used to generate single-edit variants of the input
+        self._alphabet = set()
+
+    @classmethod
+    def from_registry(cls, registry):
+        """
+        Build a resolver for every concept in a registry.
+        :param registry: ConceptRegistry, the concepts to resolve
+        :return: ConceptResolver, the built resolver
+        """
+        resolver = cls()
+        for record in registry:
+            resolver.add(record.name, record.synonyms, sort=False)
+        resolver._sorted_keys.sort()
+        return resolver
+
+    @staticmethod
+    def normalize(text):
+        """
+        :param text: str, a name or user input
+        :return: str, the text lower-cased with whitespace collapsed
+        """
+        return " ".join(text.lower().split())
+
+    @staticmethod
+    def trigrams(key):
+        """
+        :param key: str, a normalised key
+        :return: set of str, the character trigrams of the key padded with spaces
+        """
+        padded = f" {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def add(self, name, synonyms=(), sort=True):
+        """
+        Make a concept resolvable by its name and synonyms.
+        :param name: str, the concept name
+        :param synonyms: iterable of str, other names for the concept
+        :param sort: bool, keep the prefix list sorted on every insertion; bulk loads pass
+                        False and sort once at the end
+        """
+        self._order.setdefault(name, len(self._order))
+        for text, kind in ((name, "name"), *((synonym, "synonym") for synonym in synonyms)):
+            key = self.normalize(text)
+            if not key:
                 continue
-        while True:
-            explore_another = input("\nWould you like to explore another concept? (1 for yes, 2 for no): ")
-            if explore_another in ['1', '2']:
+            entries = self._entries.get(key)
+            if entries is None:
+                entries = self._entries[key] = []
+                key_id = len(self._keys)
+                self._keys.append(key)
+                grams = self.trigrams(key)
+                self._key_sizes.append(min(len(grams), 0xFFFF))
+                self._alphabet.update(key)
+                for gram in grams:
+                    postings = self._trigrams.get(gram)
+                    if postings is None:
+                        postings = self._trigrams[gram] = array("i")
+                    postings.append(key_id)
+                if sort:
+                    insort(self._sorted_keys, key)
+                else:
+                    self._sorted_keys.append(key)
+            if (name, kind) not in entries:
+                entries.append((name, kind))
+
+    def add_record(self, record):
+        """
+        Make a registry concept resolvable.
+        :param record: ConceptRecord, the concept to add
+        """
+        self.add(record.name, record.synonyms)
+
+    def candidates(self, text, k=5):
+        """
+        Rank the concepts the text may refer to. Exact names and synonyms score 1, prefixes
+        score between 0.5 and 1 by how much of the key they cover, and fuzzy matches score
+        their trigram similarity.
+        :param text: str, the user's input
+        :param k: int, maximum number of candidates
+        :return: list of (concept, score, kind) tuples, best first, where kind is 'name',
+                 'synonym', 'prefix' or 'fuzzy'
+        """
+        query = self.normalize(text)
+        if not query:
+            return []
+        best = {}
+
+        def offer(concept, score, kind):
+            if score > best.get(concept, (0.0, None))[0]:
+                best[concept] = (score, kind)
+
+        exact = self._entries.get(query, ())
+        for concept, kind in exact:
+            offer(concept, 1.0, kind)
+
+        start = bisect_left(self._sorted_keys, query)
+        for key in self._sorted_keys[start:start + self.PREFIX_SCAN_LIMIT]:
+            if not key.startswith(query):
                 break
+            if key != query:
+                score = 0.5 + 0.5 * len(query) / len(key)
+                for concept, _ in self._entries[key]:
+                    offer(concept, score, "prefix")
+
+        # Fuzzy matches only matter when the input is not itself a name or synonym
+        if not exact:
+            for key, score in self._fuzzy_matches(query):
+                for concept, _ in self._entries[key]:
+                    offer(concept, score, "fuzzy")
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], self._order[item[0]]))
+        return [(concept, score, kind) for concept, (score, kind) in ranked[:k]]
+
+    def _fuzzy_matches(self, query):
+        # Trigram candidates are scored by their trigram similarity and, when close enough in
+        # length, by a bounded edit distance; keys one edit away are also looked up directly,
+        # since a transposition in a short name can leave no trigram in common
+        matches = {}
+        check_edits = len(query) >= self.MIN_EDIT_LENGTH
+        for key_id, similarity in self._trigram_candidates(query):
+            key = self._keys[key_id]
+            score = similarity
+            if check_edits and abs(len(key) - len(query)) <= self.max_edit_distance(key):
+                distance = self.edit_distance(query, key, self.max_edit_distance(key))
+                if distance is not None:
+                    score = max(score, 1.0 - distance / max(len(query), len(key)))
+            if score >= self.MIN_SIMILARITY:
+                matches[key] = score
+        if check_edits and len(query) <= self.MAX_EDIT_VARIANT_LENGTH:
+            for key in self._single_edits(query):
+                if key in self._entries and key not in matches:
+                    score = 1.0 - 1.0 / max(len(query), len(key))
+                    if score >= self.MIN_SIMILARITY:
+                        matches[key] = score
+        return matches.items()
+
+    def _trigram_candidates(self, query):
+        grams = self.trigrams(query)
+        present = sorted((gram for gram in grams if gram in self._trigrams),
+            key=lambda gram: len(self._trigrams[gram]))
+        if not present:
+            return []
+        # Count the rarest trigrams within the budget
+        counted = 1
+        total = len(self._trigrams[present[0]])
+        while (counted < len(present)
+                and total + len(self._trigrams[present[counted]]) <= self.POSTINGS_BUDGET):
+            total += len(self._trigrams[present[counted]])
+            counted += 1
+        rest = present[counted:]
+        # Keys sharing too few trigrams to become candidates are dropped before scoring;
+        # trigrams not counted can add at most len(rest)
+        min_count = max(1, math.ceil(self.CANDIDATE_SIMILARITY * len(grams)) - len(rest))
+
+        if total <= self.SMALL_POSTINGS:
+            # Few postings (always the case for the shipped vocabulary) are counted in pure
+            # Python, so typical lookups never import NumPy
+            shared = Counter()
+            for gram in present[:counted]:
+                shared.update(self._trigrams[gram])
+            scored = heapq.nlargest(self.FUZZY_CANDIDATES, ((count / (len(grams)
+                + self._key_sizes[key_id] - count), key_id, count)
+                for key_id, count in shared.items() if count >= min_count))
+            top = [(key_id, count) for _, key_id, count in scored]
+        else:
+            top = self._count_shared_trigrams(present[:counted], len(grams), min_count)
+
+        candidates = []
+        for key_id, count in top:
+            if rest:
+                padded = f" {self._keys[key_id]} "
+                count += sum(gram in padded for gram in rest)
+            candidates.append((key_id, count / (len(grams) + self._key_sizes[key_id] - count)))
+        return candidates
+
+    def _count_shared_trigrams(self, grams, size, min_count):
+        import numpy as np
+
+        # A key's count is the length of its run once all postings are sorted
+        ids = np.sort(np.concatenate([np.frombuffer(self._trigrams[gram], dtype=np.int32)
+            for gram in grams]))
+        if min_count > 1:
+            if len(ids) < min_count:
+                return []
+            ids = ids[:len(ids) - min_count + 1][ids[:len(ids) - min_count + 1]
+                == ids[min_count - 1:]]
+        if not len(ids):
+            return []
+        starts = np.flatnonzero(np.concatenate(([True], ids[1:] != ids[:-1])))
+        candidates = ids[starts]
+        counts = np.diff(np.append(starts, len(ids))) + (min_count - 1)
+        sizes = np.frombuffer(self._key_sizes, dtype=np.uint16)[candidates]
+        similarity = counts / (size + sizes - counts)
+        if len(candidates) > self.FUZZY_CANDIDATES:
+            keep = np.argpartition(-similarity, self.FUZZY_CANDIDATES)[:self.FUZZY_CANDIDATES]
+            candidates, counts = candidates[keep], counts[keep]
+        return list(zip(candidates.tolist(), counts.tolist()))
+
+    def _single_edits(self, query):
+        # Every string one deletion, transposition, substitution or insertion away from the
+        # query, over the characters that occur in keys
+        splits = [(query[:i], query[i:]) for i in range(len(query) + 1)]
+        yield from (left + right[1:] for left, right in splits if right)
+        yield from (left + right[1] + right[0] + right[2:] for left, right in splits
+            if len(right) > 1)
+        for char in self._alphabet:
+            yield from (left + char + right[1:] for left, right in splits if right)
+            yield from (left + char + right for left, right in splits)
+
+    def max_edit_distance(self, key):
+        """
+        :param key: str, a normalised key
+        :return: int, the number of typos tolerated for the key (1 for short keys, else 2)
+        """
+        return 1 if len(key) <= self.SHORT_KEY_LENGTH else 2
+
+    @staticmethod
+    def edit_distance(a, b, max_distance):
+        """
+        Bounded Damerau-Levenshtein (optimal string alignment) distance: insertions, deletions,
+        substitutions and transpositions of adjacent characters each count as one edit.
+        :param a: str, the first string
+        :param b: str, the second string
+        :param max_distance: int, the largest distance of interest
+        :return: int, the distance, or None if it exceeds max_distance
+        """
+        if abs(len(a) - len(b)) > max_distance:
+            return None
+        before_previous = None
+        previous = list(range(len(b) + 1))
+        for i in range(1, len(a) + 1):
+            current = [i] + [0] * len(b)
+            for j in range(1, len(b) + 1):
+                current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                    previous[j - 1] + (a[i - 1] != b[j - 1]))
+                if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                    current[j] = min(current[j], before_previous[j - 2] + 1)
+            if min(current) > max_distance:
+                return None
+            before_previous, previous = previous, current
+        return previous[-1] if previous[-1] <= max_distance else None
+
+    def resolve(self, text):
+        """
+        Resolve the text to a single concept if it clearly refers to one.
+        :param text: str, the user's input
+        :return: str, the concept name, or None if nothing or several concepts match
+        """
+        candidates = self.candidates(text, 2)
+        if not candidates:
+            return None
+        if len(candidates) == 1 or candidates[0][1] - candidates[1][1] >= self.AMBIGUITY_MARGIN:
+            return candidates[0][0]
+        return None
+
+    def __len__(self):
+        return len(self._keys)
+
+_concept_resolver = None
+
+def get_concept_resolver():
+    """
+    Return the shared concept resolver, building it from the registry on first use.
+    :return: ConceptResolver, the resolver of every registered concept
+    """
+    global _concept_resolver
+    if _concept_resolver is None:
+        _concept_resolver = ConceptResolver.from_registry(registry)
+    return _concept_resolver
+
+def _is_positive_int(value):
+    """
+    :param value: object, the value to check
+    :return: bool, True if value is an integer (but not a bool) greater than zero
+    """
+    return isinstance(value, numbers.Integral) and not isinstance(value, bool) and value > 0
+
+# Define Population Simulation
+class PopulationSimulation:
+    """
+    A class simulating how a population of learners acquires the registered concepts over time.
+    Every learner holds an acquisition strength in [0, 1] for each concept. At each time step a
+    learner encounters each concept with some probability and updates its strength:
+    human learners strengthen the concept through Hebbian co-activation of its sensory inputs,
+    weighted by how emotionally salient the concept is and balanced by forgetting, while AI
+    learners follow a reward-prediction-error rule whose learning rate grows with the capacity
+    given by the model parameters (`DEFAULT_MODEL_PARAMETERS` unless given) and which never
+    forgets between encounters.
+
+    The state of all learners lives in two NumPy arrays (strengths and encounter counts). With a
+    `path` they are memory-mapped `.npy` files, so a population of millions only keeps the
+    pages being updated resident, and every `checkpoint` leaves a run that `resume` can pick up.
+    Learners are advanced in fixed-size chunks, each with its own random stream derived from
+    the seed, the chunk and the step, so chunks can be spread across processes and results do
+    not depend on the number of workers.
+    """
+    # Simulation constants, per cognitive system
+    HUMAN_ENCOUNTER_PROBABILITY = 0.05
+    HUMAN_LEARNING_RATE = 0.3
+    HUMAN_FORGETTING_RATE = 0.002
+    AI_ENCOUNTER_PROBABILITY = 0.2
+    AI_LEARNING_RATE = 0.05
+    AI_REWARD_PROBABILITY = 0.9
+    # Capacity (layers * hidden units) at which the AI learning rate equals AI_LEARNING_RATE
+    AI_REFERENCE_CAPACITY = (DEFAULT_MODEL_PARAMETERS["layers"]
+        * DEFAULT_MODEL_PARAMETERS["hidden_units"])
+    # Strength from which a learner counts as having acquired a concept
+    ACQUIRED_THRESHOLD = 0.8
+
+    def __init__(self, n_learners, cognitive_system, concepts=None, path=None, seed=0,
+            chunk_size=65536, model_parameters=None):
+        """
+        :param n_learners: int, number of simulated learners, at least 1
+        :param cognitive_system: str, 'human' or 'ai'
+        :param concepts: list of str, registered concepts to simulate, at least one (defaults
+                        to all)
+        :param path: str, optional directory holding the memory-mapped state and checkpoints;
+                        without it the state is kept in memory. It must not already hold a
+                        checkpoint (see `resume`)
+        :param seed: int, seed of the random streams
+        :param chunk_size: int, number of learners advanced together
+        :param model_parameters: dict, positive 'layers' and 'hidden_units' of AI learners
+                        (defaults to DEFAULT_MODEL_PARAMETERS)
+        """
+        import numpy as np
+
+        cognitive_system = cognitive_system.lower()
+        if cognitive_system not in ("human", "ai"):
+            raise ValueError("cognitive_system must be 'human' or 'ai'.")
+        if not _is_positive_int(n_learners):
+            raise ValueError("n_learners must be a positive integer.")
+        if not _is_positive_int(chunk_size):
+            raise ValueError("chunk_size must be a positive integer.")
+        concepts = list(concepts) if concepts is not None else list(registry.names)
+        if not concepts:
+            raise ValueError("At least one concept is required.")
+        unknown = [concept for concept in concepts if concept not in registry]
+        if unknown:
+            raise ValueError(f"Unknown concepts: {', '.join(map(str, unknown))}.")
+        model_parameters = dict(model_parameters if model_parameters is not None
+            else DEFAULT_MODEL_PARAMETERS)
+        if not all(_is_positive_int(model_parameters.get(name))
+                for name in ("layers", "hidden_units")):
+            raise ValueError("model_parameters needs positive integer 'layers' and "
+                "'hidden_units'.")
+        for name in ("layers", "hidden_units"):
+            model_parameters[name] = int(model_parameters[name])
+        self.n_learners = int(n_learners)
+        self.cognitive_system = cognitive_system
+        self.concepts = concepts
+        self.path = path
+        self.seed = seed
+        self.chunk_size = int(chunk_size)
+        self.model_parameters = model_parameters
+        self.step_count = 0
+        self.parameters = self._concept_parameters()
+
+        shape = (n_learners, len(self.concepts))
+        if path is None:
+            self.strength = np.zeros(shape, dtype=np.float32)
+            self.encounters = np.zeros(shape, dtype=np.uint32)
+        else:
+            # Creating the arrays would overwrite a checkpoint's state while leaving its
+            # simulation.json behind, so an existing checkpoint has to be resumed instead
+            if os.path.exists(os.path.join(path, "simulation.json")):
+                raise FileExistsError(f"'{path}' already holds a checkpointed simulation; "
+                    "use PopulationSimulation.resume or choose another path.")
+            os.makedirs(path, exist_ok=True)
+            self.strength = np.lib.format.open_memmap(os.path.join(path, "strength.npy"),
+                mode="w+", dtype=np.float32, shape=shape)
+            self.encounters = np.lib.format.open_memmap(os.path.join(path, "encounters.npy"),
+                mode="w+", dtype=np.uint32, shape=shape)
+            self.checkpoint()
+
+    @classmethod
+    def resume(cls, path):
+        """
+        Reopen a checkpointed simulation.
+        :param path: str, the directory the simulation was checkpointed to
+        :return: PopulationSimulation, the simulation at its last checkpoint
+        """
+        import numpy as np
+
+        with open(os.path.join(path, "simulation.json"), encoding="utf-8") as f:
+            state = json.load(f)
+        simulation = cls.__new__(cls)
+        simulation.n_learners = state["n_learners"]
+        simulation.cognitive_system = state["cognitive_system"]
+        simulation.concepts = state["concepts"]
+        simulation.path = path
+        simulation.seed = state["seed"]
+        simulation.chunk_size = state["chunk_size"]
+        simulation.model_parameters = state["model_parameters"]
+        simulation.step_count = state["step_count"]
+        simulation.parameters = {name: np.asarray(values, dtype=np.float32)
+            for name, values in state["parameters"].items()}
+        simulation.strength = np.load(os.path.join(path, "strength.npy"), mmap_mode="r+")
+        simulation.encounters = np.load(os.path.join(path, "encounters.npy"), mmap_mode="r+")
+        return simulation
+
+    def _concept_parameters(self):
+        import numpy as np
+
+        records = [registry.get(concept) for concept in self.concepts]
+        if self.cognitive_system == "human":
+            # Richer sensory grounding drives stronger presynaptic activity (Barsalou &
+            # Wiemer-Hastings, 2005), and emotionally charged concepts are consolidated faster
+            # (Borghi et al., 2018); both are scaled to average 1 across the simulated concepts.
+            activity = np.array([len(record.sensory_inputs) for record in records], dtype=float)
+            # Emotions are listed as "a, b, and c", so blank pieces between ", and" are skipped
+            salience = np.array([sum(1 for emotion in re.split(r",|\band\b", record.emotions)
+                if emotion.strip()) for record in records], dtype=float)
+            return {
+                "encounter_probability": np.full(len(records), self.HUMAN_ENCOUNTER_PROBABILITY,
+                    dtype=np.float32),
+                "activity": (activity / activity.mean()).astype(np.float32),
+                "learning_rate": (self.HUMAN_LEARNING_RATE * salience / salience.mean()
+                    ).astype(np.float32),
+                "forgetting_rate": np.full(len(records), self.HUMAN_FORGETTING_RATE,
+                    dtype=np.float32),
+            }
+        # Larger models fit the reward signal faster, with diminishing returns in capacity;
+        # log1p keeps the rate positive down to a capacity of 1
+        capacity = self.model_parameters["layers"] * self.model_parameters["hidden_units"]
+        learning_rate = (self.AI_LEARNING_RATE * math.log1p(capacity)
+            / math.log1p(self.AI_REFERENCE_CAPACITY))
+        return {
+            "encounter_probability": np.full(len(records), self.AI_ENCOUNTER_PROBABILITY,
+                dtype=np.float32),
+            "learning_rate": np.full(len(records), learning_rate, dtype=np.float32),
+            "reward_probability": np.full(len(records), self.AI_REWARD_PROBABILITY,
+                dtype=np.float32),
+        }
+
+    def step(self, steps=1, max_workers=1, executor=None):
+        """
+        Advance every learner by a number of time steps.
+        :param steps: int, number of time steps
+        :param max_workers: int, number of processes to spread the chunks over; more than one
+                        requires a memory-mapped simulation (a `path`)
+        :param executor: concurrent.futures.Executor, optional executor to use instead of
+                        creating a process pool
+        :return: PopulationSimulation, self
+        """
+        tasks = [(begin, min(begin + self.chunk_size, self.n_learners))
+            for begin in range(0, self.n_learners, self.chunk_size)]
+        if executor is None and (max_workers == 1 or len(tasks) == 1):
+            for begin, end in tasks:
+                _advance_learners(self.cognitive_system, self.parameters, self.strength[begin:end],
+                    self.encounters[begin:end], self.seed, begin // self.chunk_size,
+                    self.step_count, steps)
+        else:
+            if self.path is None:
+                raise ValueError("Parallel steps require a memory-mapped simulation (a path).")
+            self.strength.flush()
+            self.encounters.flush()
+            owns_executor = executor is None
+            if owns_executor:
+                from concurrent.futures import ProcessPoolExecutor
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            try:
+                futures = [executor.submit(_advance_learners_file, self.path,
+                    self.cognitive_system, self.parameters, begin, end, self.seed,
+                    begin // self.chunk_size, self.step_count, steps) for begin, end in tasks]
+                for future in futures:
+                    future.result()
+            finally:
+                if owns_executor:
+                    executor.shutdown()
+        self.step_count += steps
+        return self
+
+    def summary(self):
+        """
+        Summarise acquisition across the population, one chunk at a time.
+        :return: dict mapping each concept to its mean strength, the fraction of learners that
+                 acquired it and the mean number of encounters
+        """
+        import numpy as np
+
+        totals = np.zeros(len(self.concepts))
+        acquired = np.zeros(len(self.concepts))
+        encounters = np.zeros(len(self.concepts))
+        for begin in range(0, self.n_learners, self.chunk_size):
+            strength = self.strength[begin:begin + self.chunk_size]
+            totals += strength.sum(axis=0, dtype=np.float64)
+            acquired += (strength >= self.ACQUIRED_THRESHOLD).sum(axis=0)
+            encounters += self.encounters[begin:begin + self.chunk_size].sum(axis=0,
+                dtype=np.float64)
+        n = max(self.n_learners, 1)
+        return {concept: {"mean_strength": float(totals[i] / n),
+            "acquired_fraction": float(acquired[i] / n),
+            "mean_encounters": float(encounters[i] / n)} for i, concept in enumerate(self.concepts)}
+
+    def checkpoint(self):
+        """
+        Flush the memory-mapped state and record the step reached, so `resume` can continue.
+        :return: str, the checkpoint directory
+        """
+        if self.path is None:
+            raise ValueError("Only memory-mapped simulations (with a path) can be checkpointed.")
+        self.strength.flush()
+        self.encounters.flush()
+        state = {
+            "n_learners": self.n_learners,
+            "cognitive_system": self.cognitive_system,
+            "concepts": self.concepts,
+            "seed": self.seed,
+            "chunk_size": self.chunk_size,
+            "model_parameters": self.model_parameters,
+            "step_count": self.step_count,
+            "parameters": {name: values.tolist() for name, values in self.parameters.items()},
+        }
+        temporary = os.path.join(self.path, "simulation.json.tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temporary, os.path.join(self.path, "simulation.json"))
+        return self.path
+
+def _advance_learners(cognitive_system, parameters, strength, encounters, seed, chunk, step,
+        steps):
+    """
+    Advance one chunk of learners in place by a number of time steps.
+    :param cognitive_system: str, 'human' or 'ai'
+    :param parameters: dict of per-concept np.ndarray, from PopulationSimulation
+    :param strength: np.ndarray of float32, shape (learners, concepts), updated in place
+    :param encounters: np.ndarray of uint32, shape (learners, concepts), updated in place
+    :param seed: int, seed of the simulation
+    :param chunk: int, index of the chunk, which selects its random stream
+    :param step: int, time step the chunk is at
+    :param steps: int, number of time steps to advance
+    """
+    import numpy as np
+
+    shape = strength.shape
+    encountered = np.empty(shape, dtype=bool)
+    update = np.empty(shape, dtype=np.float32)
+    for t in range(step, step + steps):
+        rng = np.random.default_rng((seed, chunk, t))
+        np.less(rng.random(shape, dtype=np.float32), parameters["encounter_probability"],
+            out=encountered)
+        encounters += encountered
+        if cognitive_system == "human":
+            # Hebbian update: presynaptic sensory activity times postsynaptic activation (the
+            # current strength plus the input itself), bounded by (1 - strength); concepts that
+            # are not encountered decay
+            presynaptic = encountered * parameters["activity"]
+            np.add(strength, presynaptic, out=update)
+            update *= presynaptic
+            update *= 1.0 - strength
+            update *= parameters["learning_rate"]
+            update -= (~encountered) * parameters["forgetting_rate"] * strength
+        else:
+            # Reward-prediction-error update on encountered concepts only
+            reward = rng.random(shape, dtype=np.float32) < parameters["reward_probability"]
+            np.subtract(reward, strength, out=update)
+            update *= encountered
+            update *= parameters["learning_rate"]
+        strength += update
+        np.clip(strength, 0.0, 1.0, out=strength)
+
+def _advance_learners_file(path, cognitive_system, parameters, begin, end, seed, chunk, step,
+        steps):
+    """
+    Advance the learners begin:end of a memory-mapped simulation; runs in pool workers.
+    """
+    import numpy as np
+
+    strength = np.load(os.path.join(path, "strength.npy"), mmap_mode="r+")
+    encounters = np.load(os.path.join(path, "encounters.npy"), mmap_mode="r+")
+    _advance_learners(cognitive_system, parameters, strength[begin:end], encounters[begin:end],
+        seed, chunk, step, steps)
+    strength.flush()
+    encounters.flush()
+
+# Layout algorithms selectable for concept maps
+LAYOUTS = ("auto", "spring", "radial", "force")
+
+# Graphs with fewer nodes than this are laid out with `nx.spring_layout` when the layout is
+# "auto"; beyond it the dense O(n^2) iterations become too slow and memory-hungry (and networkx
+# switches to a sparse solver that needs scipy)
+AUTO_SPRING_MAX_NODES = 500
+
+def compute_layout(graph, layout="auto", seed=42):
+    """
+    Compute node positions for a concept map.
+    :param graph: nx.DiGraph, the graph to lay out
+    :param layout: str, one of LAYOUTS: 'spring' for `nx.spring_layout`, 'radial' for
+                    hierarchical rings around the hub, 'force' for the grid-approximated force
+                    layout, or 'auto' to use 'spring' on small graphs and 'force' on large ones
+    :param seed: int, seed for the randomised layouts
+    :return: dict mapping each node to its (x, y) position
+    """
+    if layout == "auto":
+        layout = "spring" if len(graph) < AUTO_SPRING_MAX_NODES else "force"
+    if layout == "spring":
+        import networkx as nx
+        return {node: (float(x), float(y))
+                for node, (x, y) in nx.spring_layout(graph, seed=seed).items()}
+    if layout == "radial":
+        return radial_layout(graph)
+    if layout == "force":
+        return force_layout(graph, seed=seed)
+    raise ValueError(f"Unknown layout '{layout}'. Choose one of {', '.join(LAYOUTS)}.")
+
+def radial_layout(graph):
+    """
+    Place nodes on concentric rings by breadth-first depth from the hub, giving each subtree
+    an angular wedge proportional to its number of leaves. Runs in O(n + m).
+    :param graph: nx.Graph or nx.DiGraph, the graph to lay out; its first node is taken as the
+                    hub, and edge direction is ignored
+    :return: dict mapping each node to its (x, y) position, scaled into [-1, 1]
+    """
+    if len(graph) == 0:
+        return {}
+    # Breadth-first spanning forest over the undirected structure, starting from the hub and
+    # then from any node left unreached, so disconnected parts get rings of their own wedge
+    parent = {}
+    order = []
+    depth = {}
+    children = {}
+    for root in graph:
+        if root in depth:
+            continue
+        depth[root] = 0
+        parent[root] = None
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            children[node] = []
+            if graph.is_directed():
+                neighbours = (*graph.successors(node), *graph.predecessors(node))
+            else:
+                neighbours = graph.neighbors(node)
+            for neighbour in neighbours:
+                if neighbour not in depth:
+                    depth[neighbour] = depth[node] + 1
+                    parent[neighbour] = node
+                    children[node].append(neighbour)
+                    queue.append(neighbour)
+
+    leaves = {}
+    for node in reversed(order):
+        leaves[node] = sum(leaves[child] for child in children[node]) or 1
+    roots = [node for node in order if parent[node] is None]
+    total = sum(leaves[root] for root in roots)
+
+    # Assign each node the middle of its wedge; children split the parent's wedge
+    wedge = {}
+    start = 0.0
+    for root in roots:
+        span = 2 * math.pi * leaves[root] / total
+        wedge[root] = (start, span)
+        start += span
+    max_depth = max(depth.values()) or 1
+    pos = {}
+    for node in order:
+        start, span = wedge[node]
+        radius = depth[node] / max_depth
+        angle = start + span / 2
+        pos[node] = (radius * math.cos(angle), radius * math.sin(angle))
+        for child in children[node]:
+            child_span = span * leaves[child] / leaves[node]
+            wedge[child] = (start, child_span)
+            start += child_span
+    return pos
+
+def force_layout(graph, iterations=50, seed=42, chunk_size=2048):
+    """
+    Vectorised force-directed layout for large graphs.
+    Attraction is computed along the sparse edge list only. Repulsion uses a Barnes-Hut style
+    grid approximation: nodes are binned into about sqrt(n) cells holding equal numbers of
+    nodes, nodes in the same cell repel each other exactly and every other cell acts as a
+    single mass at its centroid. Each
+    iteration therefore costs about O(n * sqrt(n)) time and, with nodes processed in chunks,
+    O(chunk_size * sqrt(n)) extra memory, instead of the O(n^2) of `nx.spring_layout`.
+    :param graph: nx.Graph or nx.DiGraph, the graph to lay out
+    :param iterations: int, number of cooling iterations
+    :param seed: int, seed for the initial positions
+    :param chunk_size: int, number of nodes whose far-field repulsion is computed at once
+    :return: dict mapping each node to its (x, y) position, scaled into [-1, 1]
+    """
+    import numpy as np
+
+    nodes = list(graph)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: (0.0, 0.0)}
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in graph.edges() if u != v],
+        dtype=np.intp).reshape(-1, 2)
+
+    rng = np.random.default_rng(seed)
+    pos = rng.random((n, 2))
+    k = 1.0 / math.sqrt(n)
+    grid = max(1, int(round(n ** 0.25)))
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        displacement = np.zeros((n, 2))
+
+        # Bin nodes into grid cells of equal occupancy: split by x rank into columns, then by
+        # y rank within each column, so clustered layouts never pile up in a single cell
+        column = np.empty(n, dtype=np.intp)
+        column[np.argsort(pos[:, 0], kind="stable")] = np.arange(n) * grid // n
+        by_column = np.lexsort((pos[:, 1], column))
+        column_sizes = np.bincount(column, minlength=grid)
+        column_starts = np.concatenate(([0], np.cumsum(column_sizes)[:-1]))
+        sorted_columns = column[by_column]
+        row = np.empty(n, dtype=np.intp)
+        row[by_column] = ((np.arange(n) - column_starts[sorted_columns]) * grid
+            // column_sizes[sorted_columns])
+        cell = column * grid + row
+        counts = np.bincount(cell, minlength=grid * grid)
+        occupied = np.flatnonzero(counts)
+        centroids = np.stack([
+            np.bincount(cell, weights=pos[:, 0], minlength=grid * grid)[occupied],
+            np.bincount(cell, weights=pos[:, 1], minlength=grid * grid)[occupied],
+        ], axis=1) / counts[occupied, None]
+        masses = counts[occupied].astype(float)
+        slot = np.full(grid * grid, -1, dtype=np.intp)
+        slot[occupied] = np.arange(len(occupied))
+        node_slot = slot[cell]
+
+        # Far field: every node against the centroids of the other cells. With weights w_ij,
+        # the summed repulsion sum_j w_ij * (p_i - c_j) is p_i * sum_j w_ij - (W @ c)_i.
+        for begin in range(0, n, chunk_size):
+            end = min(begin + chunk_size, n)
+            chunk = pos[begin:end]
+            dx = chunk[:, 0, None] - centroids[None, :, 0]
+            dy = chunk[:, 1, None] - centroids[None, :, 1]
+            weight = masses[None, :] * (k * k) / np.maximum(dx * dx + dy * dy, 1e-9)
+            weight[np.arange(end - begin), node_slot[begin:end]] = 0.0
+            displacement[begin:end] += chunk * weight.sum(axis=1)[:, None] - weight @ centroids
+
+        # Near field: exact repulsion between nodes sharing a cell
+        by_cell = np.argsort(cell, kind="stable")
+        bounds = np.concatenate(([0], np.cumsum(counts[occupied])))
+        for i in range(len(occupied)):
+            members = by_cell[bounds[i]:bounds[i + 1]]
+            if len(members) < 2:
+                continue
+            near = pos[members]
+            dx = near[:, 0, None] - near[None, :, 0]
+            dy = near[:, 1, None] - near[None, :, 1]
+            weight = (k * k) / np.maximum(dx * dx + dy * dy, 1e-9)
+            np.fill_diagonal(weight, 0.0)
+            displacement[members] += near * weight.sum(axis=1)[:, None] - weight @ near
+
+        # Attraction along edges
+        if len(edges):
+            delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+            distance = np.sqrt(np.maximum((delta ** 2).sum(axis=1), 1e-18))
+            pull = delta * (distance / k)[:, None]
+            np.subtract.at(displacement, edges[:, 0], pull)
+            np.add.at(displacement, edges[:, 1], pull)
+
+        # Move each node at most `temperature`, then cool down
+        length = np.sqrt(np.maximum((displacement ** 2).sum(axis=1), 1e-18))
+        pos += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    pos -= pos.mean(axis=0)
+    scale = np.abs(pos).max() or 1.0
+    pos /= scale
+    return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, pos)}
+
+# Define Layout Cache
+class LayoutCache:
+    """
+    A class to cache concept map layouts.
+    Concept maps for a given (concept, category) are always the same small star, yet
+    `nx.spring_layout` is iterative and randomly seeded. Layouts are therefore computed once with
+    a fixed seed, kept in an in-memory LRU and, optionally, persisted as JSON files so repeat
+    requests (and later runs) skip layout entirely and get identical positions back. Layouts are
+    computed with `compute_layout`, so any of LAYOUTS can be cached.
+    """
+    def __init__(self, maxsize=256, cache_dir=None, seed=42):
+        """
+        :param maxsize: int, maximum number of layouts kept in memory
+        :param cache_dir: str, optional directory for the on-disk layout store
+        :param seed: int, seed passed to the layout algorithm for deterministic layouts
+        """
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.seed = seed
+        self._layouts = OrderedDict()
+        # Renderers in different threads share the cache; the lock guards the LRU bookkeeping
+        # while layouts themselves are computed outside it
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_layout(self, graph, concept, category, layout="auto"):
+        """
+        Return node positions for a concept map, computing them only on a cache miss.
+        :param graph: nx.DiGraph, the concept map to lay out
+        :param concept: str, the concept the map belongs to
+        :param category: str, the category of concept acquisition
+        :param layout: str, one of LAYOUTS
+        :return: dict mapping each node to its (x, y) position
+        """
+        key = self._make_key(graph, concept, category, layout)
+        with self._lock:
+            pos = self._layouts.get(key)
+            if pos is not None:
+                self._layouts.move_to_end(key)
+                self.hits += 1
+                return pos
+            self.misses += 1
+
+        pos = self._load(key)
+        if pos is None:
+            pos = compute_layout(graph, layout, self.seed)
+            self._store(key, pos)
+        with self._lock:
+            self._layouts[key] = pos
+            if len(self._layouts) > self.maxsize:
+                self._layouts.popitem(last=False)
+        return pos
+
+    def clear(self):
+        """
+        Drop every in-memory layout; the on-disk store is left untouched.
+        """
+        with self._lock:
+            self._layouts.clear()
+
+    def __len__(self):
+        return len(self._layouts)
+
+    def _make_key(self, graph, concept, category, layout):
+        # The graph shape is part of the key so that a change to a category's nodes never
+        # serves a stale layout. It is reduced to a digest so keys stay small for large graphs.
+        shape = repr((sorted(graph.nodes), sorted(graph.edges))).encode("utf-8")
+        return (concept, category, layout, hashlib.sha1(shape).hexdigest())
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr((key, self.seed)).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load(self, key):
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return {node: tuple(xy) for node, xy in json.load(f).items()}
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key, pos):
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._path(key), "w", encoding="utf-8") as f:
+            json.dump(pos, f)
+
+default_layout_cache = LayoutCache()
+
+def output_path(output_dir, stem, output_format):
+    """
+    Build the path a rendered map is written to. Request text (concepts and categories) ends
+    up in the file name, so anything but letters, digits, '_' and '-' is replaced and a short
+    digest of the original stem keeps distinct stems apart; a "/" or ".." therefore can never
+    leave output_dir.
+    :param output_dir: str, the directory maps are written to
+    :param stem: str, the file name stem, e.g. '<concept>_<category>'
+    :param output_format: str, 'png' or 'svg'
+    :return: str, the path of the file inside output_dir
+    """
+    slug = re.sub(r"[^\w-]+", "_", stem)
+    if slug != stem.replace(" ", "_"):
+        slug += "-" + hashlib.sha1(stem.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(output_dir, f"{slug}.{output_format}")
+
+# Define Concept Map Renderer
+class ConceptMapRenderer:
+    """
+    A class to draw AI concept maps either interactively or off-screen.
+    Interactive rendering opens a pyplot window, as the chatbot always has. Off-screen rendering
+    draws onto a single reusable Agg-backed figure, so no display is required and no figures are
+    left behind between calls; the result is returned as bytes or written to `output_dir`.
+    """
+    def __init__(self, output_format=None, output_dir=None, figsize=(10, 8), dpi=100,
+            layout_cache=None):
+        """
+        :param output_format: str, 'png' or 'svg' for off-screen rendering; None to display
+                        the concept map interactively
+        :param output_dir: str, optional directory to write rendered maps to instead of
+                        returning bytes
+        :param figsize: tuple, figure size in inches
+        :param dpi: int, resolution used for raster output
+        :param layout_cache: LayoutCache, cache of node positions; defaults to the module-wide
+                        cache shared by all renderers
+        """
+        if output_format is not None and output_format not in ("png", "svg"):
+            raise ValueError("output_format must be 'png', 'svg' or None.")
+        self.output_format = output_format
+        self.output_dir = output_dir
+        self.figsize = figsize
+        self.dpi = dpi
+        self.layout_cache = layout_cache if layout_cache is not None else default_layout_cache
+        self._figure = None
+
+    @property
+    def interactive(self):
+        return self.output_format is None
+
+    def draw(self, graph, concept, category, layout="auto"):
+        """
+        Draw a concept map graph.
+        :param graph: nx.DiGraph, the concept map from ConceptKnowledgeGraph.subgraph
+        :param concept: str, the concept the map belongs to
+        :param category: str, the category of concept acquisition
+        :param layout: str, the layout algorithm, one of LAYOUTS
+        :return: None when displayed interactively, otherwise bytes of the rendered image or
+                 the path it was written to
+        """
+        title = f"Concept Map for AI Acquisition of '{concept}' - {category}"
+        if self.interactive:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=self.figsize)
+            self._draw_graph(graph, fig.gca(), title, concept, category, layout)
+            with stage_metrics.span("display"):
+                plt.show()
+                plt.close(fig)
+            return None
+
+        # Reuse one figure across renders; clearing it is far cheaper than building a new
+        # figure and canvas for every map, and nothing accumulates in pyplot's figure registry.
+        if self._figure is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self._figure = Figure(figsize=self.figsize, dpi=self.dpi)
+            FigureCanvasAgg(self._figure)
+        fig = self._figure
+        fig.clear()
+        self._draw_graph(graph, fig.add_subplot(), title, concept, category, layout)
+
+        if self.output_dir is not None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = output_path(self.output_dir, f"{concept}_{category}", self.output_format)
+            with stage_metrics.span("save"):
+                fig.savefig(path, format=self.output_format)
+            return path
+        buffer = io.BytesIO()
+        with stage_metrics.span("save"):
+            fig.savefig(buffer, format=self.output_format)
+        return buffer.getvalue()
+
+    def render_batch(self, requests):
+        """
+        Render concept maps for many (concept, category) pairs in one call.
+        :param requests: iterable of (concept, category) tuples
+        :return: list of rendered outputs, in the same order as the requests
+        """
+        knowledge_graph = get_knowledge_graph()
+        return [self.draw(knowledge_graph.subgraph(concept, 'ai', category), concept, category)
+                for concept, category in requests]
+
+    def close(self):
+        """
+        Release the reusable figure held for off-screen rendering.
+        """
+        if self._figure is not None:
+            self._figure.clear()
+            self._figure = None
+
+    def _draw_graph(self, graph, ax, title, concept, category, layout):
+        import networkx as nx
+        with stage_metrics.span("layout"):
+            pos = self.layout_cache.get_layout(graph, concept, category, layout)
+        with stage_metrics.span("draw"):
+            nx.draw(graph, pos, ax=ax, with_labels=True,
+                node_size=[graph.nodes[node].get('size', 800) for node in graph],
+                font_size=10, font_weight='bold')
+            ax.set_title(title)
+
+_default_renderer = ConceptMapRenderer()
+
+def get_default_renderer():
+    """
+    Return the renderer used by AICognition.acquire_concept when none is given.
+    :return: ConceptMapRenderer, the module-wide renderer
+    """
+    return _default_renderer
+
+def set_default_renderer(renderer):
+    """
+    Replace the renderer used by AICognition.acquire_concept when none is given, e.g. with
+    ConceptMapRenderer(output_format='png') on servers without a display.
+    :param renderer: ConceptMapRenderer, the new module-wide renderer
+    """
+    global _default_renderer
+    _default_renderer = renderer
+
+# Define Comparison Renderer
+class ComparisonRenderer:
+    """
+    A class to draw several concept maps of one concept side by side in a single figure, e.g.
+    every category for one cognitive system, or the human and AI maps of one category.
+    The figure, its panels and each panel's artists (node markers, edge arrows, labels and
+    title) are created once and then updated in place, and they are marked animated so that only
+    they are redrawn over a cached background (blitting). Switching the comparison to another
+    concept therefore neither rebuilds the figure nor redraws its static parts, whether it is
+    shown interactively or rendered off-screen.
+    """
+    # Panels show layouts scaled into [-1, 1] within these fixed axis limits, so the cached
+    # background stays valid from one comparison to the next
+    PANEL_LIMIT = 1.35
+    NODE_COLOR = "#1f78b4"
+
+    def __init__(self, output_format=None, output_dir=None, panel_size=(4, 3.2), dpi=100,
+            layout_cache=None, columns=3, label_width=24):
+        """
+        :param output_format: str, 'png' or 'svg' for off-screen rendering; None to display
+                        the comparison interactively
+        :param output_dir: str, optional directory to write rendered comparisons to instead of
+                        returning bytes
+        :param panel_size: tuple, size of one panel in inches
+        :param dpi: int, resolution used for raster output
+        :param layout_cache: LayoutCache, cache of node positions; defaults to the module-wide
+                        cache shared by all renderers
+        :param columns: int, maximum number of panels per row when comparing categories
+        :param label_width: int, number of characters after which node labels are wrapped
+        """
+        if output_format is not None and output_format not in ("png", "svg"):
+            raise ValueError("output_format must be 'png', 'svg' or None.")
+        self.output_format = output_format
+        self.output_dir = output_dir
+        self.panel_size = panel_size
+        self.dpi = dpi
+        self.layout_cache = layout_cache if layout_cache is not None else default_layout_cache
+        self.columns = columns
+        self.label_width = label_width
+        self._figure = None
+        self._shape = None
+        self._panels = []
+        self._suptitle = None
+        self._background = None
+
+    @property
+    def interactive(self):
+        return self.output_format is None
+
+    def compare_categories(self, concept, cognitive_system="ai", categories=None, layout="auto"):
+        """
+        Draw the concept maps of every category for one cognitive system.
+        :param concept: str, the concept to compare
+        :param cognitive_system: str, 'human' or 'ai'
+        :param categories: iterable of str, the categories to include (defaults to all)
+        :param layout: str, the layout algorithm, one of LAYOUTS
+        :return: None when displayed interactively, otherwise bytes of the rendered image or
+                 the path it was written to
+        """
+        categories = list(categories) if categories is not None else list(registry.categories)
+        columns = min(self.columns, len(categories))
+        shape = (math.ceil(len(categories) / columns), columns)
+        label = "AI" if cognitive_system == 'ai' else "Human"
+        return self.draw([(concept, cognitive_system, category) for category in categories],
+            shape, f"{label} Concept Maps for '{concept}'", f"{concept}_{cognitive_system}",
+            layout)
+
+    def compare_systems(self, concept, category, layout="auto"):
+        """
+        Draw the human and AI concept maps of one category next to each other.
+        :param concept: str, the concept to compare
+        :param category: str, the category of concept acquisition
+        :param layout: str, the layout algorithm, one of LAYOUTS
+        :return: None when displayed interactively, otherwise bytes of the rendered image or
+                 the path it was written to
+        """
+        return self.draw([(concept, 'human', category), (concept, 'ai', category)], (1, 2),
+            f"Human vs AI Concept Maps for '{concept}' - {category}", f"{concept}_{category}",
+            layout)
+
+    def compare_all(self, concept, layout="auto"):
+        """
+        Draw every category for both cognitive systems, one row per system.
+        :param concept: str, the concept to compare
+        :param layout: str, the layout algorithm, one of LAYOUTS
+        :return: None when displayed interactively, otherwise bytes of the rendered image or
+                 the path it was written to
+        """
+        categories = registry.categories
+        return self.draw([(concept, cognitive_system, category)
+            for cognitive_system in ConceptKnowledgeGraph.COGNITIVE_SYSTEMS
+            for category in categories], (2, len(categories)),
+            f"Human vs AI Concept Maps for '{concept}'", f"{concept}_comparison", layout)
+
+    def draw(self, panels, shape, title, name, layout="auto"):
+        """
+        Draw concept maps into the panels of one figure, reusing the figure and its artists
+        when the grid shape is unchanged.
+        :param panels: list of (concept, cognitive_system, category) tuples, in row order
+        :param shape: tuple, (rows, columns) of the panel grid
+        :param title: str, the title of the figure
+        :param name: str, file name stem used when writing to output_dir
+        :param layout: str, the layout algorithm, one of LAYOUTS
+        :return: None when displayed interactively, otherwise bytes of the rendered image or
+                 the path it was written to
+        """
+        if len(panels) > shape[0] * shape[1]:
+            raise ValueError("More panels than the grid can hold.")
+        if self._figure is None or self._shape != shape or not self._is_open():
+            self._build_figure(shape)
+        knowledge_graph = get_knowledge_graph()
+        for panel, (concept, cognitive_system, category) in zip(self._panels, panels):
+            with stage_metrics.span("build_graph"):
+                graph = knowledge_graph.subgraph(concept, cognitive_system, category)
+            with stage_metrics.span("layout"):
+                pos = self.layout_cache.get_layout(graph, concept, category, layout)
+            label = "AI" if cognitive_system == 'ai' else "Human"
+            with stage_metrics.span("draw"):
+                panel.update(graph, pos, f"{label} - {category}", self.label_width)
+        for panel in self._panels[len(panels):]:
+            panel.hide()
+        self._suptitle.set_text(title)
+
+        with stage_metrics.span("draw"):
+            self._blit()
+        if self.interactive:
+            with stage_metrics.span("display"):
+                self._figure.canvas.blit(self._figure.bbox)
+                self._figure.canvas.flush_events()
+            return None
+
+        if self.output_dir is not None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = output_path(self.output_dir, name, self.output_format)
+            with stage_metrics.span("save"):
+                with open(path, "wb") as f:
+                    self._save(f)
+            return path
+        buffer = io.BytesIO()
+        with stage_metrics.span("save"):
+            self._save(buffer)
+        return buffer.getvalue()
+
+    def close(self):
+        """
+        Release the figure and its artists.
+        """
+        if self._figure is not None:
+            if self.interactive:
+                import matplotlib.pyplot as plt
+                plt.close(self._figure)
             else:
-                print("Invalid input. Please enter 1 for yes or 2 for no.")
-        if explore_another == '2':
-            print("\nChat ended by user.")
-            break
+                self._figure.clear()
+        self._figure = None
+        self._shape = None
+        self._panels = []
+        self._background = None
+
+    def _build_figure(self, shape):
+        self.close()
+        rows, columns = shape
+        figsize = (self.panel_size[0] * columns, self.panel_size[1] * rows + 0.6)
+        if self.interactive:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=figsize)
+        else:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            fig = Figure(figsize=figsize, dpi=self.dpi)
+            FigureCanvasAgg(fig)
+        self._figure = fig
+        self._shape = shape
+        self._suptitle = fig.suptitle("", fontsize=14, fontweight='bold', animated=True)
+        # Node sizes are given for the full-size 10-inch concept map; scale them to the panel
+        node_scale = self.panel_size[0] / 10
+        for i in range(rows * columns):
+            ax = fig.add_subplot(rows, columns, i + 1)
+            ax.set_xlim(-self.PANEL_LIMIT, self.PANEL_LIMIT)
+            ax.set_ylim(-self.PANEL_LIMIT, self.PANEL_LIMIT)
+            ax.set_aspect('equal')
+            ax.set_axis_off()
+            self._panels.append(_ComparisonPanel(ax, node_scale, self.NODE_COLOR))
+        fig.canvas.mpl_connect("draw_event", self._on_draw)
+        if self.interactive:
+            import matplotlib.pyplot as plt
+            plt.show(block=False)
+
+    def _is_open(self):
+        # An interactive figure closed by the user has to be rebuilt
+        if not self.interactive:
+            return True
+        import matplotlib.pyplot as plt
+        return plt.fignum_exists(self._figure.number)
+
+    def _on_draw(self, event):
+        # A full redraw (first render, window resize) leaves out the animated artists; keep
+        # the result as the new background and put the artists back on top of it
+        canvas = self._figure.canvas
+        if canvas.is_saving() or not hasattr(canvas, "copy_from_bbox"):
+            return
+        self._background = canvas.copy_from_bbox(self._figure.bbox)
+        self._draw_artists()
+
+    def _blit(self):
+        canvas = self._figure.canvas
+        if self._background is None:
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            self._draw_artists()
+
+    def _draw_artists(self):
+        fig = self._figure
+        fig.draw_artist(self._suptitle)
+        for panel in self._panels:
+            for artist in panel.artists():
+                fig.draw_artist(artist)
+
+    def _save(self, f):
+        if self.output_format == "png":
+            # The canvas already holds the blitted image, so encode it as is instead of
+            # letting savefig redraw the whole figure
+            import numpy as np
+            from matplotlib.image import imsave
+            imsave(f, np.asarray(self._figure.canvas.buffer_rgba()), format="png", dpi=self.dpi)
+        else:
+            self._figure.savefig(f, format=self.output_format)
+
+class _ComparisonPanel:
+    """
+    The reusable artists of one comparison panel.
+    """
+    __slots__ = ("ax", "node_scale", "nodes", "edges", "labels", "title")
+
+    def __init__(self, ax, node_scale, node_color):
+        self.ax = ax
+        self.node_scale = node_scale
+        self.nodes = ax.scatter([], [], c=node_color, animated=True, zorder=2)
+        self.edges = None
+        self.labels = []
+        self.title = ax.set_title("", fontsize=10, animated=True)
+
+    def update(self, graph, pos, title, label_width):
+        import textwrap
+        import numpy as np
+
+        ax = self.ax
+        ax.set_visible(True)
+        nodes = list(graph)
+        index = {node: i for i, node in enumerate(nodes)}
+        xy = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+        sizes = np.array([graph.nodes[node].get('size', 800) for node in nodes],
+            dtype=float) * self.node_scale
+        self.nodes.set_offsets(xy)
+        self.nodes.set_sizes(sizes)
+        self.nodes.set_visible(True)
+
+        # Arrows run between the rims of the node markers: marker radii are converted from
+        # points to data units with the panel's current scale
+        edges = np.array([(index[u], index[v]) for u, v in graph.edges()],
+            dtype=np.intp).reshape(-1, 2)
+        if self.edges is not None and self.edges.N != len(edges):
+            self.edges.remove()
+            self.edges = None
+        if len(edges):
+            ax.apply_aspect()
+            points_to_data = (ax.figure.dpi / 72) * (2 * ComparisonRenderer.PANEL_LIMIT
+                / ax.bbox.width)
+            radius = np.sqrt(sizes) / 2 * points_to_data
+            tail, head = xy[edges[:, 0]], xy[edges[:, 1]]
+            delta = head - tail
+            length = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)
+            unit = delta / length[:, None]
+            start = tail + unit * radius[edges[:, 0], None]
+            vector = delta * np.clip(1 - (radius[edges[:, 0]] + radius[edges[:, 1]]) / length,
+                0, None)[:, None]
+            if self.edges is None:
+                self.edges = ax.quiver(start[:, 0], start[:, 1], vector[:, 0], vector[:, 1],
+                    angles='xy', scale_units='xy', scale=1, width=0.005, headwidth=4,
+                    headlength=5, color='k', animated=True, zorder=1)
+            else:
+                self.edges.set_offsets(start)
+                self.edges.set_UVC(vector[:, 0], vector[:, 1])
+            self.edges.set_visible(True)
+
+        while len(self.labels) < len(nodes):
+            self.labels.append(ax.text(0, 0, "", ha='center', va='center', fontsize=7,
+                fontweight='bold', animated=True, zorder=3))
+        for text, node, (x, y) in zip(self.labels, nodes, xy):
+            text.set_position((x, y))
+            text.set_text(textwrap.fill(str(node), label_width))
+            text.set_visible(True)
+        for text in self.labels[len(nodes):]:
+            text.set_visible(False)
+        self.title.set_text(title)
+        self.title.set_visible(True)
+
+    def hide(self):
+        for artist in self.artists():
+            artist.set_visible(False)
+
+    def artists(self):
+        return [artist for artist in (self.edges, self.nodes, *self.labels, self.title)
+            if artist is not None]
+
+_comparison_renderer = None
+
+def compare_concept(concept, cognitive_system=None, category=None, renderer=None, layout="auto"):
+    """
+    Draw several concept maps of a concept in one figure: every category for one cognitive
+    system, both cognitive systems for one category, or, with neither given, every category for
+    both cognitive systems.
+    :param concept: str, the concept to compare, as accepted by resolve_concept (its number,
+                    name, a synonym, a prefix or a misspelling)
+    :param cognitive_system: str, 'human' or 'ai', to compare the categories of one system
+    :param category: str, the category of concept acquisition, to compare the two systems
+    :param renderer: ComparisonRenderer, optional renderer; defaults to a module-wide one that
+                    renders like the default concept map renderer (interactive unless
+                    configured otherwise)
+    :param layout: str, the layout algorithm, one of LAYOUTS
+    :return: None when displayed interactively, otherwise bytes of the rendered image or the
+             path it was written to
+    """
+    global _comparison_renderer
+    resolved = resolve_concept(concept)
+    if resolved is None:
+        raise ValueError(f"Unknown or ambiguous concept '{concept}'.")
+    concept = resolved
+    if cognitive_system is not None and category is not None:
+        raise ValueError("Give a cognitive system or a category to compare, not both.")
+    if renderer is None:
+        default = get_default_renderer()
+        if (_comparison_renderer is None
+                or _comparison_renderer.output_format != default.output_format
+                or _comparison_renderer.output_dir != default.output_dir):
+            if _comparison_renderer is not None:
+                _comparison_renderer.close()
+            _comparison_renderer = ComparisonRenderer(default.output_format, default.output_dir,
+                dpi=default.dpi, layout_cache=default.layout_cache)
+        renderer = _comparison_renderer
+    if category is not None:
+        return renderer.compare_systems(concept, category, layout)
+    if cognitive_system is not None:
+        return renderer.compare_categories(concept, cognitive_system.lower(), layout=layout)
+    return renderer.compare_all(concept, layout)
+
+# Define Explanation Cache
+class ExplanationCache:
+    """
+    A class to memoize chatbot explanations.
+    An explanation depends only on its (concept, cognitive system, category), so responses are
+    kept in a bounded LRU with hit/miss counters. The text is built without drawing the AI
+    concept map; off-screen maps depend only on the concept, category and renderer, so they are
+    kept in a second, smaller LRU, while interactive renderers redraw on every request since the
+    map has to be shown again.
+    """
+    def __init__(self, maxsize=1024, max_concept_maps=256):
+        """
+        :param maxsize: int, maximum number of explanations kept
+        :param max_concept_maps: int, maximum number of off-screen concept maps kept
+        """
+        self.maxsize = maxsize
+        self.max_concept_maps = max_concept_maps
+        self._explanations = OrderedDict()
+        self._concept_maps = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_explanation(self, concept, cognitive_system, category):
+        """
+        Return the explanation for a request, computing it only on a cache miss.
+        :param concept: str, a concept known to the registry
+        :param cognitive_system: str, 'human' or 'ai'
+        :param category: str, the category of concept acquisition
+        :return: str, detailed explanation of concept acquisition
+        """
+        key = (concept, cognitive_system, category)
+        explanation = self._explanations.get(key)
+        if explanation is not None:
+            self._explanations.move_to_end(key)
+            self.hits += 1
+            return explanation
+
+        self.misses += 1
+        explanation = explain_concept(concept, cognitive_system, category, render=False)
+        self._explanations[key] = explanation
+        if len(self._explanations) > self.maxsize:
+            self._explanations.popitem(last=False)
+        return explanation
+
+    def get_concept_map(self, concept, category, renderer=None):
+        """
+        Return the AI concept map for a request, drawing it only on a cache miss unless the
+        renderer is interactive.
+        :param concept: str, a concept known to the registry
+        :param category: str, the category of concept acquisition
+        :param renderer: ConceptMapRenderer, optional renderer; defaults to the module-wide one
+        :return: None when displayed interactively, otherwise bytes of the rendered image or
+                 the path it was written to
+        """
+        renderer = renderer or get_default_renderer()
+        if renderer.interactive:
+            return AICognition.for_concept(concept).render_concept_map(category, renderer)
+        key = (concept, category, renderer)
+        concept_map = self._concept_maps.get(key)
+        # A written map is only reused while its file is still there
+        if concept_map is not None and (not isinstance(concept_map, str)
+                or os.path.exists(concept_map)):
+            self._concept_maps.move_to_end(key)
+            return concept_map
+
+        concept_map = AICognition.for_concept(concept).render_concept_map(category, renderer)
+        self._concept_maps[key] = concept_map
+        if len(self._concept_maps) > self.max_concept_maps:
+            self._concept_maps.popitem(last=False)
+        return concept_map
+
+    def warm_up(self):
+        """
+        Precompute every (concept, cognitive system, category) combination.
+        :return: int, the number of explanations computed
+        """
+        computed = 0
+        for cognitive_system in ('human', 'ai'):
+            for concept in registry.names:
+                for category in registry.categories:
+                    if (concept, cognitive_system, category) not in self._explanations:
+                        self.get_explanation(concept, cognitive_system, category)
+                        computed += 1
+        return computed
+
+    def clear(self):
+        """
+        Drop every cached explanation and concept map and reset the counters.
+        """
+        self._explanations.clear()
+        self._concept_maps.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._explanations)
+
+explanation_cache = ExplanationCache()
+
+def reload_registry(path=CONCEPTS_PATH):
+    """
+    Reload the concept data file and invalidate everything derived from the old data,
+    including the knowledge graph, similarity index and concept resolver.
+    :param path: str, path to the JSON or TOML concept data file
+    :return: ConceptRegistry, the new registry
+    """
+    global registry, _knowledge_graph, _similarity_index, _concept_resolver
+    registry = ConceptRegistry.from_file(path)
+    HumanCognition._instances.clear()
+    AICognition._instances.clear()
+    explanation_cache.clear()
+    _knowledge_graph = None
+    _similarity_index = None
+    _concept_resolver = None
+    return registry
+
+def explain_concept(concept, cognitive_system, category, render=True):
+    """
+    Build the explanation of concept acquisition for a resolved concept, without caching.
+    :param concept: str, the concept to be explored
+    :param cognitive_system: str, the cognitive system to be used ('human' or 'ai')
+    :param category: str, the category of concept acquisition
+    :param render: bool, False to skip drawing the AI concept map
+    :return: str, detailed explanation of concept acquisition
+    """
+    if cognitive_system == 'human':
+        # Human Cognition Explanation
+        human = HumanCognition.for_concept(concept)
+        detailed_explanation = f"\n--- Human Concept Acquisition Process ---\n"
+        detailed_explanation += f"Category: {category}\n"
+        detailed_explanation += human.acquire_concept(category)
+        return detailed_explanation
+
+    elif cognitive_system == 'ai':
+        # AI Cognition Explanation
+        ai = AICognition.for_concept(concept)
+        detailed_explanation = f"\n--- AI Concept Acquisition Process ---\n"
+        detailed_explanation += f"Category: {category}\n"
+        detailed_explanation += ai.acquire_concept(category, render=render)
+        closing_message = (
+            "\nThe exploration of the concept is complete. "
+            "Feel free to choose another concept to explore!"
+            )
+        return detailed_explanation + closing_message
+
+    else:
+        return "Invalid cognitive system. Please choose either 'human' or 'ai'."
+
+def resolve_concept(user_input):
+    """
+    Resolve the user's concept choice to a concept name.
+    :param user_input: str, the number of the concept as shown to the user, or its name, a
+                    synonym, a prefix or a misspelling of either
+    :return: str, the concept name, or None if the input does not clearly name one concept
+    """
+    user_input = user_input.strip()
+    if user_input.isdecimal():
+        record = registry.get(int(user_input))
+        return record.name if record is not None else None
+    return get_concept_resolver().resolve(user_input)
+
+def concept_candidates(user_input, k=5):
+    """
+    List the concepts the user's input may refer to, for suggesting alternatives.
+    :param user_input: str, the user's concept choice
+    :param k: int, maximum number of candidates
+    :return: list of (concept, score, kind) tuples, best first
+    """
+    user_input = user_input.strip()
+    if user_input.isdecimal():
+        record = registry.get(int(user_input))
+        return [(record.name, 1.0, "number")] if record is not None else []
+    return get_concept_resolver().candidates(user_input, k)
+
+# Chatbot function to explain concept acquisition
+def chatbot_explanation(user_input, cognitive_system, category):
+    """
+    Provide a detailed explanation of concept acquisition for a given concept,
+    cognitive system, and category.
+    :param user_input: str, user-provided input indicating the concept to be explored
+    :param cognitive_system: str, the cognitive system to be used ('human' or 'ai')
+    :param category: str, the category of concept acquisition (e.g., sensory processing,
+                    context interpretation)
+    :return: str, detailed explanation of concept acquisition
+    """
+    return chatbot_response(user_input, cognitive_system, category)[0]
+
+def chatbot_response(user_input, cognitive_system, category, renderer=None, render=True):
+    """
+    Explain concept acquisition like chatbot_explanation, also returning the AI concept map.
+    Both come from the explanation cache; the concept map is only redrawn on repeat requests
+    when the renderer displays it interactively.
+    :param user_input: str, user-provided input indicating the concept to be explored
+    :param cognitive_system: str, the cognitive system to be used ('human' or 'ai')
+    :param category: str, the category of concept acquisition
+    :param renderer: ConceptMapRenderer, optional renderer; defaults to the module-wide one
+    :param render: bool, False to answer with the text only
+    :return: tuple, (explanation, concept_map) where concept_map is the renderer's output for
+             AI requests (bytes or a file path off-screen, None when displayed) and None otherwise
+    """
+    if user_input.lower() == 'quit':
+        return "Chat ended.", None
+
+    concept = resolve_concept(user_input)
+    if concept is None:
+        candidates = concept_candidates(user_input)
+        if candidates:
+            return (f"Ambiguous concept choice '{user_input}'. Did you mean: "
+                + ", ".join(candidate for candidate, _, _ in candidates) + "?"), None
+        return (f"Invalid concept choice. Please choose a number between 1 and {len(registry)} "
+            "or enter a concept name."), None
+
+    cognitive_system = cognitive_system.lower()
+    if cognitive_system not in ('human', 'ai'):
+        return "Invalid cognitive system. Please choose either 'human' or 'ai'.", None
+    with stage_metrics.span("request_total"):
+        explanation = explanation_cache.get_explanation(concept, cognitive_system, category)
+        concept_map = None
+        if cognitive_system == 'ai' and render:
+            concept_map = explanation_cache.get_concept_map(concept, category, renderer)
+        return explanation, concept_map
+
+# Concept map renderers owned by the current thread, keyed by (output_format, output_dir), so
+# each worker in a batch pool reuses one figure for all of its renders. A renderer's figure
+# must never be drawn on by two threads at once, so thread pools get one renderer per thread.
+_worker_renderers = threading.local()
+
+def render_concept_map_offscreen(concept, category, output_format="png", output_dir=None):
+    """
+    Render one AI concept map off-screen with this thread's shared renderer. Being a
+    module-level function, it can be submitted to process and thread pools alike.
+    :param concept: str, the concept the map belongs to
+    :param category: str, the category of concept acquisition
+    :param output_format: str, 'png' or 'svg'
+    :param output_dir: str, optional directory to write the map to instead of returning bytes
+    :return: bytes of the rendered map, or the path it was written to
+    """
+    renderers = getattr(_worker_renderers, "renderers", None)
+    if renderers is None:
+        renderers = _worker_renderers.renderers = {}
+    key = (output_format, output_dir)
+    renderer = renderers.get(key)
+    if renderer is None:
+        renderer = renderers[key] = ConceptMapRenderer(output_format, output_dir)
+    return AICognition.for_concept(concept).render_concept_map(category, renderer)
+
+def render_concept_map_with_spans(concept, category, output_format="png", output_dir=None):
+    """
+    Render like render_concept_map_offscreen, also returning the stage spans of the render so
+    a parent process can add them to its metrics with `stage_metrics.merge`.
+    :return: tuple, (rendered map as from render_concept_map_offscreen, list of spans)
+    """
+    with stage_metrics.capture() as spans:
+        concept_map = render_concept_map_offscreen(concept, category, output_format, output_dir)
+    return concept_map, spans
+
+# Batch function to explain many requests at once
+def batch_explanations(requests, output_format="png", output_dir=None, max_workers=None,
+        executor=None, window=256):
+    """
+    Explain many concept acquisition requests, rendering AI concept maps in a process pool.
+    Text is assembled inline while concept maps are rendered off-screen by the pool. Identical
+    requests within the look-ahead window share one explanation and one render, and results
+    are yielded in input order, so memory stays bounded by the window however long the batch is.
+    After every request read, all results at the head of the queue that are already complete
+    are yielded, so a slowly arriving stream is answered as it goes rather than once the window
+    fills; the window only bounds how far reading runs ahead of unfinished renders.
+    :param requests: iterable of (user_input, cognitive_system, category) tuples, as accepted
+                    by chatbot_explanation
+    :param output_format: str, 'png' or 'svg', the format of rendered concept maps
+    :param output_dir: str, optional directory to write concept maps to instead of returning bytes
+    :param max_workers: int, number of rendering processes (defaults to the number of CPUs)
+    :param executor: concurrent.futures.Executor, optional executor to use instead of creating
+                    a process pool
+    :param window: int, number of requests submitted ahead of the one being yielded
+    :return: generator of (request, explanation, concept_map) tuples, where concept_map is the
+             rendered bytes or file path for AI requests, the exception raised if rendering
+             failed, and None otherwise
+    """
+    if output_format not in ("png", "svg"):
+        raise ValueError("output_format must be 'png' or 'svg'.")
+    owns_executor = executor is None
+    if owns_executor:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    # Renders report their stage spans back when metrics are on, since pool workers have
+    # their own (disabled) stage_metrics
+    collect_spans = stage_metrics.enabled
+    render = render_concept_map_with_spans if collect_spans else render_concept_map_offscreen
+    # key -> [explanation, future or None, number of pending requests sharing it]
+    entries = {}
+    pending = deque()
+
+    def head_ready():
+        key = pending[0][1]
+        if key is None:
+            return True
+        future = entries[key][1]
+        return future is None or future.done()
+
+    def pop_result():
+        request, key, explanation = pending.popleft()
+        if key is None:
+            return request, explanation, None
+        entry = entries[key]
+        entry[2] -= 1
+        if entry[2] == 0:
+            del entries[key]
+        if entry[1] is None:
+            return request, entry[0], None
+        # A failed render is reported for its own requests instead of ending the batch
+        try:
+            concept_map = entry[1].result()
+        except Exception as e:
+            return request, entry[0], e
+        if collect_spans:
+            concept_map, spans = concept_map
+            # Merged once per render, by the first request sharing it
+            if spans:
+                stage_metrics.merge(spans)
+                spans.clear()
+        return request, entry[0], concept_map
+
+    try:
+        for request in requests:
+            user_input, cognitive_system, category = request
+            concept = resolve_concept(user_input)
+            cognitive_system = cognitive_system.lower()
+            if concept is None or cognitive_system not in ('human', 'ai'):
+                pending.append((request, None, chatbot_explanation(*request)))
+            else:
+                key = (concept, cognitive_system, category)
+                entry = entries.get(key)
+                if entry is None:
+                    explanation = explanation_cache.get_explanation(concept, cognitive_system,
+                        category)
+                    future = None
+                    if cognitive_system == 'ai':
+                        future = executor.submit(render, concept, category, output_format,
+                            output_dir)
+                    entry = entries[key] = [explanation, future, 0]
+                entry[2] += 1
+                pending.append((request, key, None))
+            while pending and (len(pending) > window or head_ready()):
+                yield pop_result()
+        while pending:
+            yield pop_result()
+    finally:
+        if owns_executor:
+            executor.shutdown(cancel_futures=True)
+
+# Define Dialogue Session
+class DialogueSession:
+    """
+    A class modelling one chatbot conversation as an explicit, non-blocking state machine.
+    Instead of blocking on input(), the session is fed one user reply at a time through
+    `respond` and reports what to show and which prompt to ask next. Its whole state is three
+    small fields, so sessions can be serialised with `to_record` and resumed with `from_record`,
+    letting one worker multiplex many conversations. AI concept maps are only drawn with the
+    renderer passed to `respond` and are returned with the text, so a session never opens a
+    window unless given an interactive renderer.
+    """
+    __slots__ = ("state", "user_input", "cognitive_system")
+
+    # Conversation states
+    CONCEPT, SYSTEM, CATEGORY, EXPLORE_MORE, CROSS_EXPLORE, CROSS_CATEGORY, EXPLORE_ANOTHER, \
+        ENDED = range(8)
+
+    YES_NO_ERROR = "Invalid input. Please enter 1 for yes or 2 for no."
+
+    def __init__(self, state=CONCEPT, user_input="", cognitive_system=""):
+        """
+        :param state: int, the state the conversation is in
+        :param user_input: str, the concept choice entered by the user
+        :param cognitive_system: str, the cognitive system chosen by the user ('human' or 'ai')
+        """
+        self.state = state
+        self.user_input = user_input
+        self.cognitive_system = cognitive_system
+
+    @property
+    def ended(self):
+        return self.state == self.ENDED
+
+    @property
+    def prompt(self):
+        """
+        The prompt to show for the next user reply.
+        """
+        state = self.state
+        if state == self.CONCEPT:
+            return "\nEnter the number or name of the concept you'd like to explore: "
+        if state == self.SYSTEM:
+            return "\nWould you like to explore the concept acquisition by 'human' or 'ai'?: "
+        if state == self.CATEGORY:
+            return "\nEnter the number of the category you'd like to focus on: "
+        if state == self.EXPLORE_MORE:
+            return ("\nWould you like to explore another aspect of this concept/category? "
+                "(1 for yes, 2 for no): ")
+        if state == self.CROSS_EXPLORE:
+            return (f"\nWould you like to explore the same concept by {self._other_label()}? "
+                "(1 for yes, 2 for no): ")
+        if state == self.CROSS_CATEGORY:
+            return ("\nEnter the number of the category you'd like to focus on for "
+                f"{self._other_label()}: ")
+        if state == self.EXPLORE_ANOTHER:
+            return "\nWould you like to explore another concept? (1 for yes, 2 for no): "
+        return ""
+
+    def start(self):
+        """
+        Begin the conversation.
+        :return: str, the text to show before the first prompt
+        """
+        self.state = self.CONCEPT
+        return self._concept_list()
+
+    def respond(self, reply, renderer=None):
+        """
+        Advance the conversation with one user reply.
+        :param reply: str, the user's answer to the current prompt
+        :param renderer: ConceptMapRenderer, renderer for AI concept maps; None answers with
+                        text only
+        :return: tuple, (text to show before the next prompt, possibly empty; the AI concept
+                 map drawn for this reply as returned by the renderer, or None)
+        """
+        output = self._advance(reply, renderer)
+        if isinstance(output, tuple):
+            return output
+        return output, None
+
+    def _advance(self, reply, renderer):
+        # Returns the text to show, or (text, concept map) for replies that explain a concept
+        state = self.state
+        if state == self.CONCEPT:
+            if reply.lower() == 'quit':
+                self.state = self.ENDED
+                return "\nChat ended by user."
+            self.user_input = reply
+            self.state = self.SYSTEM
+            return ""
+
+        if state == self.SYSTEM:
+            if reply.lower() not in ('human', 'ai'):
+                self.state = self.CONCEPT
+                return ("Invalid choice. Please choose either 'human' or 'ai'.\n"
+                    + self._concept_list())
+            self.cognitive_system = reply.lower()
+            self.state = self.CATEGORY
+            return self._category_list()
+
+        if state == self.CATEGORY:
+            category = registry.category(int(reply)) if reply.isdecimal() else None
+            if category is None:
+                return (f"Invalid category choice. Please choose a number between 1 and "
+                    f"{len(registry.categories)}.\n" + self._category_list())
+            self.state = self.EXPLORE_MORE
+            return chatbot_response(self.user_input, self.cognitive_system, category, renderer,
+                render=renderer is not None)
+
+        if state == self.EXPLORE_MORE:
+            if reply not in ('1', '2'):
+                return self.YES_NO_ERROR
+            if reply == '1':
+                self.state = self.CATEGORY
+                return self._category_list()
+            self.state = self.CROSS_EXPLORE
+            return ""
+
+        if state == self.CROSS_EXPLORE:
+            if reply not in ('1', '2'):
+                return self.YES_NO_ERROR
+            self.state = self.CROSS_CATEGORY if reply == '1' else self.EXPLORE_ANOTHER
+            return ""
+
+        if state == self.CROSS_CATEGORY:
+            category = registry.category(int(reply)) if reply.isdecimal() else None
+            other = 'ai' if self.cognitive_system == 'human' else 'human'
+            self.state = self.CONCEPT
+            if category is None:
+                return self._concept_list()
+            explanation, concept_map = chatbot_response(self.user_input, other, category,
+                renderer, render=renderer is not None)
+            return explanation + "\n" + self._concept_list(), concept_map
+
+        if state == self.EXPLORE_ANOTHER:
+            if reply not in ('1', '2'):
+                return self.YES_NO_ERROR
+            if reply == '2':
+                self.state = self.ENDED
+                return "\nChat ended by user."
+            self.state = self.CONCEPT
+            return self._concept_list()
+        return ""
+
+    def to_record(self):
+        """
+        Serialise the session.
+        :return: tuple, a compact (state, user_input, cognitive_system) record
+        """
+        return (self.state, self.user_input, self.cognitive_system)
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Restore a session serialised with `to_record`.
+        :param record: sequence, a (state, user_input, cognitive_system) record
+        :return: DialogueSession, the restored session
+        """
+        return cls(*record)
+
+    def _other_label(self):
+        return "AI" if self.cognitive_system == 'human' else "Human"
+
+    def _concept_list(self):
+        return "\nAvailable Concepts:\n" + "\n".join(
+            f"{i}. {concept}" for i, concept in enumerate(registry.names, start=1))
+
+    def _category_list(self):
+        return "\nAvailable Categories:\n" + "\n".join(
+            f"{i}. {category}" for i, category in enumerate(registry.categories, start=1))
+
+# Define Session Store
+class SessionStore:
+    """
+    A class multiplexing many dialogue sessions in one worker.
+    Sessions are kept only as compact records between replies and can be saved to and loaded
+    from a JSON file, so conversations survive worker restarts.
+    """
+    def __init__(self, renderer=None):
+        """
+        :param renderer: ConceptMapRenderer, renderer for AI concept maps, normally off-screen;
+                        None answers with text only
+        """
+        self.renderer = renderer
+        self._records = {}
+
+    def open(self, session_id):
+        """
+        Start a new conversation.
+        :param session_id: hashable, identifier of the session
+        :return: tuple, (text to show, next prompt)
+        """
+        session = DialogueSession()
+        output = session.start()
+        self._records[session_id] = session.to_record()
+        return output, session.prompt
+
+    def respond(self, session_id, reply):
+        """
+        Feed one user reply to a session.
+        :param session_id: hashable, identifier of an open session
+        :param reply: str, the user's answer to the session's current prompt
+        :return: tuple, (text to show, AI concept map or None, next prompt, whether the
+                 conversation has ended)
+        """
+        session = DialogueSession.from_record(self._records[session_id])
+        output, concept_map = session.respond(reply, self.renderer)
+        if session.ended:
+            del self._records[session_id]
+        else:
+            self._records[session_id] = session.to_record()
+        return output, concept_map, session.prompt, session.ended
+
+    def save(self, path):
+        """
+        Write every open session to a JSON file.
+        :param path: str, path of the file to write
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({str(session_id): record for session_id, record in self._records.items()}, f)
+
+    @classmethod
+    def load(cls, path, renderer=None):
+        """
+        Restore sessions written by `save`. Session ids are restored as strings.
+        :param path: str, path of the file to read
+        :param renderer: ConceptMapRenderer, renderer for AI concept maps, as for __init__
+        :return: SessionStore, the restored store
+        """
+        store = cls(renderer)
+        with open(path, encoding="utf-8") as f:
+            store._records = {session_id: tuple(record) for session_id, record in json.load(f).items()}
+        return store
+
+    def __contains__(self, session_id):
+        return session_id in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+# Streaming function to explain JSON Lines requests
+def stream_explanations(lines, output_format="png", output_dir=None, max_workers=None,
+        window=256, executor=None):
+    """
+    Explain a stream of JSON Lines requests, yielding one response per request in input order.
+    Each request is an object with "user_input", "cognitive_system" and "category" fields, plus
+    an optional "id" that is echoed back. Lines are parsed lazily and fed through
+    batch_explanations, so at most `window` requests are buffered at any time.
+    :param lines: iterable of str, the JSON Lines input
+    :param output_format: str, 'png' or 'svg', the format of rendered concept maps
+    :param output_dir: str, optional directory to write concept maps to; otherwise maps are
+                    returned base64-encoded in the response
+    :param max_workers: int, number of rendering processes
+    :param window: int, number of requests buffered ahead of the one being yielded
+    :param executor: concurrent.futures.Executor, optional executor to render concept maps
+                    with instead of a new process pool
+    :return: generator of response dicts, each with the request fields, "explanation",
+             "concept_map", "error" (None unless the request was malformed or its concept map
+             failed to render) and "elapsed_ms" (time from reading the request to its response)
+    """
+    # Metadata for requests still in flight, consumed in the same order results come back
+    in_flight = deque()
+
+    def parse(lines):
+        for line in lines:
+            if not line.strip():
+                continue
+            started = time.perf_counter()
+            try:
+                request = json.loads(line)
+                fields = (str(request["user_input"]), str(request["cognitive_system"]),
+                    str(request["category"]))
+                in_flight.append((request.get("id"), started, None))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                fields = ("", "", "")
+                in_flight.append((None, started, f"Malformed request: {e}"))
+            yield fields
+
+    results = batch_explanations(parse(lines), output_format=output_format,
+        output_dir=output_dir, max_workers=max_workers, executor=executor, window=window)
+    for (user_input, cognitive_system, category), explanation, concept_map in results:
+        request_id, started, error = in_flight.popleft()
+        if error is not None:
+            explanation = error
+        elif isinstance(concept_map, Exception):
+            error = f"Concept map rendering failed: {concept_map}"
+            concept_map = None
+        if isinstance(concept_map, bytes):
+            concept_map = base64.b64encode(concept_map).decode("ascii")
+        response = {
+            "id": request_id,
+            "user_input": user_input,
+            "cognitive_system": cognitive_system,
+            "category": category,
+            "explanation": explanation,
+            "concept_map": concept_map,
+            "error": error,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+        yield response
+
+def run_stream(infile, outfile, **kwargs):
+    """
+    Read JSON Lines requests from `infile` and write JSON Lines responses to `outfile`,
+    flushing after each response so consumers see results incrementally.
+    :param infile: file object to read requests from
+    :param outfile: file object to write responses to
+    :param kwargs: options passed through to stream_explanations
+    :return: int, the number of responses written
+    """
+    count = 0
+    for response in stream_explanations(infile, **kwargs):
+        outfile.write(json.dumps(response) + "\n")
+        outfile.flush()
+        count += 1
+    return count
+
+def parse_args(argv=None):
+    """
+    Parse the command-line options for the chatbot.
+    :param argv: list of str, arguments to parse (defaults to sys.argv)
+    :return: argparse.Namespace, the parsed options
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Human vs AI Concept Acquisition Chatbot")
+    parser.add_argument("--stream", "--batch", dest="stream", nargs="?", const="-",
+        metavar="FILE", help="read JSON Lines requests from FILE (or stdin) instead of "
+        "chatting interactively, and write JSON Lines responses to stdout")
+    parser.add_argument("--format", dest="output_format", choices=("png", "svg"), default="png",
+        help="format of rendered concept maps in stream mode")
+    parser.add_argument("--output-dir", help="write concept maps to this directory in stream "
+        "mode instead of embedding them in the responses")
+    parser.add_argument("--workers", type=int, default=None,
+        help="number of concept map rendering processes in stream mode")
+    parser.add_argument("--window", type=int, default=256,
+        help="maximum number of requests buffered in stream mode")
+    return parser.parse_args(argv)
+
+# Main chat loop
+if __name__ == "__main__":
+    """
+    Main loop for the chatbot, allowing users to interactively explore how humans and AI
+    acquire and understand various concepts. Users can select concepts, choose between human
+    or AI cognition, and explore different aspects of concept acquisition.
+    """
+    args = parse_args()
+    if args.stream is not None:
+        options = dict(output_format=args.output_format, output_dir=args.output_dir,
+            max_workers=args.workers, window=args.window)
+        if args.stream == "-":
+            run_stream(sys.stdin, sys.stdout, **options)
+        else:
+            with open(args.stream, encoding="utf-8") as infile:
+                run_stream(infile, sys.stdout, **options)
+        sys.exit(0)
+
+    print("Welcome to the Human vs AI Concept Acquisition Chatbot!")
+    print("Here, you can explore how humans and AI acquire and understand various concepts.")
+    print(
+    "You will be asked to provide a concept, choose a cognitive system (human or AI), "
+    "and then explore specific categories of how that system forms a concept."
+    )
+    print("Type 'quit' to exit the chat.")
+    session = DialogueSession()
+    print(session.start())
+    while not session.ended:
+        # The command-line chat shows AI concept maps with the module-wide renderer
+        output, _ = session.respond(input(session.prompt), get_default_renderer())
+        if output:
+            print(output)
@@ -0,0 +1,92 @@
+"""
+Layout scaling benchmark for large concept maps.
+
+Builds synthetic concept maps shaped like the extended vocabulary (a hub linked to concepts,
+each concept linked to a few mechanisms shared across concepts) at increasing node counts and
+times every layout algorithm on them, reporting latency and peak traced memory.
+`nx.spring_layout` is skipped above --spring-max nodes, where it becomes impractically slow
+(and, from 500 nodes, requires scipy).
+
+Usage:
+    python benchmarks/bench_layout.py [--sizes 100,1000,10000] [--spring-max N] [--json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ConceptAquisitionSimulation as cas
+
+def build_concept_graph(size, mechanisms_per_concept=3, seed=0):
+    """
+    Build a synthetic concept map with about `size` nodes.
+    :param size: int, target number of nodes
+    :param mechanisms_per_concept: int, edges from each concept to shared mechanisms
+    :param seed: int, seed for choosing mechanisms
+    :return: nx.DiGraph, the concept map
+    """
+    import networkx as nx
+
+    rng = random.Random(seed)
+    concepts = max(1, int(size * 0.8))
+    mechanisms = max(mechanisms_per_concept, size - concepts - 1)
+    graph = nx.DiGraph()
+    graph.add_node("hub")
+    for c in range(concepts):
+        graph.add_edge("hub", f"concept {c}")
+        for m in rng.sample(range(mechanisms), mechanisms_per_concept):
+            graph.add_edge(f"concept {c}", f"mechanism {m}")
+    return graph
+
+def time_layout(graph, layout):
+    """
+    Time one layout and measure its peak traced memory in a separate run.
+    :return: dict with 'seconds' and 'peak_mib'
+    """
+    started = time.perf_counter()
+    cas.compute_layout(graph, layout)
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    cas.compute_layout(graph, layout)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": seconds, "peak_mib": peak / (1024 * 1024)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100,300,1000,3000,10000",
+        help="comma-separated node counts")
+    parser.add_argument("--spring-max", type=int, default=499,
+        help="largest graph to time nx.spring_layout on")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        graph = build_concept_graph(size)
+        row = {"nodes": len(graph), "edges": graph.number_of_edges()}
+        for layout in ("spring", "radial", "force"):
+            if layout == "spring" and len(graph) > args.spring_max:
+                row[layout] = None
+                continue
+            row[layout] = time_layout(graph, layout)
+        results.append(row)
+        if not args.json:
+            cells = []
+            for layout in ("spring", "radial", "force"):
+                result = row[layout]
+                cells.append(f"{'-':>22}" if result is None else
+                    f"{result['seconds'] * 1000:>12.1f} ms {result['peak_mib']:>5.1f} MiB")
+            if len(results) == 1:
+                print(f"{'nodes':>8}{'edges':>8}{'spring':>22}{'radial':>22}{'force':>22}")
+            print(f"{row['nodes']:>8}{row['edges']:>8}{''.join(cells)}")
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
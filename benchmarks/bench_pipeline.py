@@ -0,0 +1,232 @@
+"""
+Benchmark suite covering every stage of an explanation request.
+
+Stages are timed headlessly (concept maps are rendered off-screen to PNG) and reported as
+latency percentiles, throughput and peak traced memory. Results can be saved as a baseline and
+later runs compared against it; a stage whose median latency grows beyond the threshold is
+reported as a regression and makes the run exit non-zero.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--repeat N] [--stage NAME ...]
+        [--save-baseline FILE] [--compare FILE] [--threshold RATIO] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ConceptAquisitionSimulation as cas
+
+def _concept(i):
+    return cas.registry.names[i % len(cas.registry)]
+
+def _category(i):
+    return cas.registry.categories[i % len(cas.registry.categories)]
+
+def build_stages():
+    """
+    Build the benchmark stages.
+    :return: tuple, (dict mapping stage name to a callable taking the iteration index,
+             dict mapping stage name to a setup callable run before the stage)
+    """
+    import networkx as nx
+
+    renderer = cas.ConceptMapRenderer(output_format="png")
+    cas.set_default_renderer(renderer)
+    uncached_layouts = cas.LayoutCache(maxsize=0)
+    uncached_renderer = cas.ConceptMapRenderer(output_format="png", layout_cache=uncached_layouts)
+    comparison_renderer = cas.ComparisonRenderer(output_format="png")
+    knowledge = cas.get_knowledge_graph()
+    graphs = {(concept, category): knowledge.subgraph(concept, "ai", category)
+        for concept in cas.registry.names for category in cas.registry.categories}
+
+    def human_construction(i):
+        human = cas.HumanCognition(_concept(i))
+        return (human.sensory_inputs, human.innate_structure, human.situational_context,
+            human.memory, human.emotions)
+
+    def ai_construction(i):
+        ai = cas.AICognition(_concept(i))
+        return ai.training_data, ai.fine_tuning_data
+
+    def graph_construction(i):
+        # The shared knowledge graph keeps extracted maps, so each iteration extracts from a
+        # fresh one-concept index to time building the map rather than looking it up
+        fresh = cas.ConceptKnowledgeGraph(cas.registry.categories)
+        fresh.add_concept(_concept(i))
+        return fresh.subgraph(_concept(i), "ai", _category(i))
+
+    def spring_layout(i):
+        return nx.spring_layout(graphs[(_concept(i), _category(i))], seed=42)
+
+    def draw(i):
+        concept, category = _concept(i), _category(i)
+        return renderer.draw(graphs[(concept, category)], concept, category)
+
+    def draw_uncached_layout(i):
+        concept, category = _concept(i), _category(i)
+        return uncached_renderer.draw(graphs[(concept, category)], concept, category)
+
+    def draw_all_categories(i):
+        concept = _concept(i)
+        return [renderer.draw(graphs[(concept, category)], concept, category)
+            for category in cas.registry.categories]
+
+    def comparison_all_categories(i):
+        return comparison_renderer.compare_categories(_concept(i), "ai")
+
+    def chatbot_human_uncached(i):
+        cas.explanation_cache.clear()
+        return cas.chatbot_explanation(str(i % len(cas.registry) + 1), "human", _category(i))
+
+    def chatbot_ai_uncached(i):
+        cas.explanation_cache.clear()
+        return cas.chatbot_explanation(str(i % len(cas.registry) + 1), "ai", _category(i))
+
+    def chatbot_cached(i):
+        return cas.chatbot_explanation(str(i % len(cas.registry) + 1), "ai", _category(i))
+
+    stages = {
+        "human_construction": human_construction,
+        "ai_construction": ai_construction,
+    }
+    for category in cas.registry.categories:
+        name = category.replace(" ", "_")
+        stages[f"human_acquire_{name}"] = (
+            lambda i, category=category: cas.HumanCognition(_concept(i)).acquire_concept(category))
+        stages[f"ai_acquire_{name}"] = (
+            lambda i, category=category: cas.AICognition(_concept(i)).acquire_concept(category))
+    stages.update({
+        "graph_construction": graph_construction,
+        "spring_layout": spring_layout,
+        "draw": draw,
+        "draw_uncached_layout": draw_uncached_layout,
+        "draw_all_categories": draw_all_categories,
+        "comparison_all_categories": comparison_all_categories,
+        "chatbot_human_uncached": chatbot_human_uncached,
+        "chatbot_ai_uncached": chatbot_ai_uncached,
+        "chatbot_cached": chatbot_cached,
+    })
+    def warm_chatbot_cache():
+        # warm_up only fills in text, so draw each off-screen concept map once as well
+        cas.explanation_cache.warm_up()
+        for concept in cas.registry.names:
+            for category in cas.registry.categories:
+                cas.explanation_cache.get_concept_map(concept, category)
+
+    setups = {"chatbot_cached": warm_chatbot_cache}
+    return stages, setups
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of already sorted values.
+    """
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def run_stage(fn, repeat, warmup, setup=None):
+    """
+    Time one stage, then measure its peak traced memory in a separate pass so tracing does
+    not distort the latencies.
+    :param fn: callable taking the iteration index
+    :param repeat: int, number of timed iterations
+    :param warmup: int, number of untimed iterations run first
+    :param setup: callable, optional preparation run before the warmup
+    :return: dict, latency percentiles (ms), throughput (ops/s) and peak memory (KiB)
+    """
+    if setup is not None:
+        setup()
+    for i in range(warmup):
+        fn(i)
+    latencies = []
+    started = time.perf_counter()
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn(i)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    for i in range(min(repeat, 20)):
+        fn(i)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "throughput_ops": repeat / elapsed if elapsed else float("inf"),
+        "peak_kib": peak / 1024,
+    }
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a saved baseline.
+    :param results: dict, stage results of this run
+    :param baseline: dict, stage results of the baseline run
+    :param threshold: float, ratio of median latencies above which a stage has regressed
+    :return: list of (stage, baseline p50, current p50, ratio, regressed) tuples
+    """
+    rows = []
+    for stage, result in results.items():
+        if stage not in baseline:
+            continue
+        before, after = baseline[stage]["p50_ms"], result["p50_ms"]
+        ratio = after / before if before else float("inf")
+        rows.append((stage, before, after, ratio, ratio > threshold))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="timed iterations per stage")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed iterations per stage")
+    parser.add_argument("--stage", action="append", help="run only the named stage(s)")
+    parser.add_argument("--save-baseline", metavar="FILE", help="save results to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=1.2,
+        help="median latency ratio above which a stage counts as regressed")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    stages, setups = build_stages()
+    if args.stage:
+        unknown = set(args.stage) - set(stages)
+        if unknown:
+            parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+        stages = {name: stages[name] for name in args.stage}
+
+    results = {name: run_stage(fn, args.repeat, args.warmup, setups.get(name))
+        for name, fn in stages.items()}
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'stage':<40}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>12}{'peak KiB':>11}")
+        for name, result in results.items():
+            print(f"{name:<40}{result['p50_ms']:>10.3f}{result['p95_ms']:>10.3f}"
+                f"{result['p99_ms']:>10.3f}{result['throughput_ops']:>12.1f}"
+                f"{result['peak_kib']:>11.1f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.threshold)
+        print(f"\n{'stage':<40}{'baseline p50':>14}{'current p50':>13}{'ratio':>8}")
+        for stage, before, after, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{stage:<40}{before:>14.3f}{after:>13.3f}{ratio:>8.2f}{flag}")
+        if any(row[4] for row in rows):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Startup benchmark for the concept acquisition chatbot.
+
+Each sample runs in a fresh interpreter and measures, for the human path (by concept number
+and by a misspelled free-text name, which goes through fuzzy resolution) and the AI path
+separately, how long it takes to import the module, how long the first explanation takes and
+the peak resident memory of the process. The AI path renders its concept map off-screen, which
+is what pulls in networkx and matplotlib.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat N] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sampled paths: label -> (chatbot path, concept typed by the user)
+PATHS = {
+    "human": ("human", "1"),
+    "human-text": ("human", "lvoe"),
+    "ai": ("ai", "1"),
+}
+
+# Program run in each fresh interpreter; prints one JSON sample
+SAMPLE_PROGRAM = """
+import json, resource, sys, time
+started = time.perf_counter()
+import ConceptAquisitionSimulation as cas
+imported = time.perf_counter()
+path, concept = sys.argv[1], sys.argv[2]
+if path == "ai":
+    cas.set_default_renderer(cas.ConceptMapRenderer(output_format="png"))
+cas.chatbot_explanation(concept, path, "memory retrieval")
+answered = time.perf_counter()
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_response_ms": (answered - imported) * 1000,
+    "peak_rss_mb": rss_kb / 1024,
+    "heavy_modules": sorted(m for m in ("networkx", "matplotlib", "numpy") if m in sys.modules),
+}))
+"""
+
+def run_sample(label):
+    """
+    Measure one cold start of a path in a fresh interpreter.
+    :param label: str, a key of PATHS
+    :return: dict, the measurements of the sample
+    """
+    result = subprocess.run([sys.executable, "-c", SAMPLE_PROGRAM, *PATHS[label]], cwd=REPO_ROOT,
+        env=dict(os.environ, MPLBACKEND="Agg"), capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def summarize(samples):
+    """
+    Reduce samples of one path to medians and worst cases.
+    :param samples: list of dict, samples from run_sample
+    :return: dict, summary of the samples
+    """
+    summary = {}
+    for field in ("import_ms", "first_response_ms", "peak_rss_mb"):
+        values = [sample[field] for sample in samples]
+        summary[field] = {"median": statistics.median(values), "max": max(values)}
+    summary["heavy_modules"] = samples[-1]["heavy_modules"]
+    return summary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="cold starts per path")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {label: summarize([run_sample(label) for _ in range(args.repeat)])
+        for label in PATHS}
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'path':<12}{'import ms':>12}{'first response ms':>20}{'peak RSS MB':>14}  heavy modules")
+    for path, summary in results.items():
+        print(f"{path:<12}{summary['import_ms']['median']:>12.1f}"
+            f"{summary['first_response_ms']['median']:>20.1f}"
+            f"{summary['peak_rss_mb']['median']:>14.1f}  "
+            f"{', '.join(summary['heavy_modules']) or '-'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Tests for the HTTP/JSON chatbot server, in particular that malformed requests are answered
+with an error status instead of dropping the connection.
+"""
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ChatbotServer
+import ConceptAquisitionSimulation as cas
+
+def exchange(raw, server_options=None):
+    """
+    Start a server on a free port, send one raw request and return the parsed response.
+    :param raw: bytes, the complete request to send
+    :param server_options: dict, extra keyword arguments for ChatbotServer
+    :return: tuple, (status code, decoded JSON body)
+    """
+    async def run():
+        executor = ThreadPoolExecutor(2)
+        server = ChatbotServer.ChatbotServer(port=0, executor=executor, request_timeout=5,
+            **(server_options or {}))
+        listener = await server.start()
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw)
+            await writer.drain()
+            writer.write_eof()
+            response = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+        finally:
+            server.close()
+            executor.shutdown()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return int(head.split(b" ")[1]), json.loads(body)
+
+    return asyncio.run(run())
+
+def get(target):
+    return exchange(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("ascii"))
+
+def post(target, body, content_length=None):
+    length = len(body) if content_length is None else content_length
+    return exchange(f"POST {target} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {length}\r\n\r\n".encode("ascii") + body)
+
+def test_concepts_lists_registry():
+    status, payload = get("/concepts")
+    assert status == 200
+    assert [concept["name"] for concept in payload["concepts"]] == list(cas.registry.names)
+
+def test_explain_human():
+    status, payload = get("/explain?user_input=1&cognitive_system=human"
+        "&category=memory%20retrieval")
+    assert status == 200
+    assert payload["concept"] == cas.registry.names[0]
+    assert payload["concept_map"] is None
+
+def test_explain_ai_renders_map():
+    status, payload = post("/explain", json.dumps({"user_input": "love",
+        "cognitive_system": "ai", "category": "memory retrieval"}).encode("utf-8"))
+    assert status == 200
+    assert payload["concept"] == "love"
+    assert payload["concept_map"]
+
+def test_non_numeric_content_length():
+    status, payload = post("/explain", b"{}", content_length="abc")
+    assert status == 400
+    assert "Content-Length" in payload["error"]
+
+def test_negative_content_length():
+    status, payload = post("/explain", b"{}", content_length="-5")
+    assert status == 400
+    assert "Content-Length" in payload["error"]
+
+def test_body_shorter_than_content_length():
+    status, _ = post("/explain", b"{}", content_length=10)
+    assert status == 400
+
+def test_oversized_body():
+    status, _ = post("/explain", b"{}", content_length=10 ** 9)
+    assert status == 413
+
+def test_related_with_non_ascii_digit():
+    status, payload = get("/related?concept=%C2%B2")
+    assert status == 400
+    assert "Unknown concept" in payload["error"]
+
+def test_related_by_number_and_name():
+    assert get("/related?concept=3&k=2") == get("/related?concept=love&k=2")
+
+def test_unexpected_error_answers_500(monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(cas, "related_concepts", fail)
+    status, payload = get("/related?concept=love")
+    assert status == 500
+    assert payload == {"error": "Internal server error."}
+
+def test_unknown_path():
+    assert get("/nowhere")[0] == 404
+
+def test_render_spans_reach_metrics():
+    cas.stage_metrics.reset()
+    cas.stage_metrics.enable()
+    try:
+        status, payload = post("/explain", json.dumps({"user_input": "fear",
+            "cognitive_system": "ai", "category": "memory retrieval"}).encode("utf-8"))
+        stages = cas.stage_metrics.snapshot()
+    finally:
+        cas.stage_metrics.disable()
+        cas.stage_metrics.reset()
+    assert status == 200 and payload["concept_map"]
+    assert stages["draw"]["calls"] == 1 and stages["save"]["calls"] == 1
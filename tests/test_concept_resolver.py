@@ -0,0 +1,74 @@
+"""
+Tests for free-text concept resolution, in particular typo tolerance on the shipped vocabulary
+and that resolving it does not import NumPy.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import ConceptAquisitionSimulation as cas
+
+@pytest.mark.parametrize("text, expected", [
+    ("lvoe", "love"), ("loev", "love"), ("fera", "fear"), ("faer", "fear"),
+    ("trsut", "trust"), ("truts", "trust"), ("tust", "trust"), ("chnage", "change"),
+    ("sucses", "success"), ("knowlege", "knowledge"),
+])
+def test_typos_resolve(text, expected):
+    assert cas.resolve_concept(text) == expected
+    assert cas.concept_candidates(text)[0][0] == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("Love", "love"), ("  fear ", "fear"), ("liberty", "freedom"), ("1", "freedom"),
+])
+def test_exact_synonym_and_number(text, expected):
+    assert cas.resolve_concept(text) == expected
+
+def test_unknown_and_non_ascii_digits():
+    assert cas.resolve_concept("xyz") is None
+    assert cas.concept_candidates("xyz") == []
+    assert cas.resolve_concept("²") is None
+
+def test_short_prefix_is_ambiguous():
+    assert cas.resolve_concept("f") is None
+    assert len(cas.concept_candidates("f")) > 1
+
+@pytest.mark.parametrize("a, b, max_distance, expected", [
+    ("tust", "trust", 1, 1), ("lvoe", "love", 1, 1), ("sucses", "success", 2, 2),
+    ("abc", "abc", 0, 0), ("abcd", "dcba", 2, None), ("a", "abcd", 2, None),
+])
+def test_edit_distance(a, b, max_distance, expected):
+    assert cas.ConceptResolver.edit_distance(a, b, max_distance) == expected
+
+def test_large_vocabulary_matches_small_postings_path():
+    resolver = cas.ConceptResolver()
+    for i in range(3000):
+        resolver.add(f"concept{i:04d}", sort=False)
+    resolver.add("photosynthesis")
+    queries = ["photosyntehsis", "fotosynthesis", "concpet0042", "photo"]
+    expected = [resolver.candidates(query) for query in queries]
+    resolver.SMALL_POSTINGS = 0
+    assert [resolver.candidates(query) for query in queries] == expected
+    assert resolver.resolve("photosyntehsis") == "photosynthesis"
+
+def test_text_lookup_does_not_import_numpy():
+    program = ("import sys, ConceptAquisitionSimulation as cas; "
+        "assert cas.resolve_concept('lvoe') == 'love'; print('numpy' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", program], cwd=REPO_ROOT,
+        capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+def test_long_input_typos_resolve_without_edit_variants():
+    resolver = cas.ConceptResolver()
+    for i in range(2000):
+        resolver.add(f"concept{i:04d}", sort=False)
+    resolver.add("photosynthesis")
+    resolver.add("metacognition")
+    assert len("photosyntehsis") > resolver.MAX_EDIT_VARIANT_LENGTH
+    assert resolver.resolve("photosyntehsis") == "photosynthesis"
+    assert resolver.resolve("metacogintion") == "metacognition"
+    assert resolver.resolve("metacognitio") == "metacognition"
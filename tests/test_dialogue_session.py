@@ -0,0 +1,126 @@
+"""
+Tests for the non-blocking dialogue state machine and the session store multiplexing it.
+"""
+import os
+import sys
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import ConceptAquisitionSimulation as cas
+
+Session = cas.DialogueSession
+
+class CountingRenderer(cas.ConceptMapRenderer):
+    """
+    Renderer counting its draws; interactive unless given an output format.
+    """
+    def __init__(self, output_format=None):
+        super().__init__(output_format=output_format)
+        self.draws = 0
+
+    def draw(self, *args, **kwargs):
+        self.draws += 1
+        if self.interactive:
+            return None
+        return super().draw(*args, **kwargs)
+
+@pytest.fixture
+def default_renderer():
+    previous = cas.get_default_renderer()
+    renderer = CountingRenderer()
+    cas.set_default_renderer(renderer)
+    cas.explanation_cache.clear()
+    yield renderer
+    cas.set_default_renderer(previous)
+    cas.explanation_cache.clear()
+
+def converse(session, replies, renderer=None):
+    """
+    :return: list of (text, concept map, state after the reply) for each reply
+    """
+    steps = []
+    for reply in replies:
+        text, concept_map = session.respond(reply, renderer)
+        steps.append((text, concept_map, session.state))
+    return steps
+
+def test_full_conversation(default_renderer):
+    session = Session()
+    assert "Available Concepts" in session.start()
+    steps = converse(session, ["love", "ai", "1", "2", "1", "2", "fear"])
+    states = [state for _, _, state in steps]
+    assert states == [Session.SYSTEM, Session.CATEGORY, Session.EXPLORE_MORE,
+        Session.CROSS_EXPLORE, Session.CROSS_CATEGORY, Session.CONCEPT, Session.SYSTEM]
+    assert "AI Concept Acquisition" in steps[2][0]
+    assert "Human Concept Acquisition" in steps[5][0] and "Available Concepts" in steps[5][0]
+
+def test_invalid_replies_keep_or_reset_state(default_renderer):
+    session = Session(Session.SYSTEM, "love")
+    assert "Invalid choice" in session.respond("robot")[0]
+    assert session.state == Session.CONCEPT
+    session = Session(Session.CATEGORY, "love", "human")
+    for reply in ("0", "99", "²", "x"):
+        assert "Invalid category choice" in session.respond(reply)[0]
+        assert session.state == Session.CATEGORY
+    session = Session(Session.EXPLORE_MORE, "love", "human")
+    assert session.respond("3") == (Session.YES_NO_ERROR, None)
+    assert session.state == Session.EXPLORE_MORE
+
+def test_quit_and_decline_end_the_conversation():
+    session = Session()
+    session.respond("quit")
+    assert session.ended and session.prompt == ""
+    session = Session(Session.EXPLORE_ANOTHER, "love", "ai")
+    session.respond("2")
+    assert session.ended
+
+def test_without_renderer_no_map_is_drawn(default_renderer):
+    session = Session(Session.CATEGORY, "love", "ai")
+    text, concept_map = session.respond("1")
+    assert "AI Concept Acquisition" in text
+    assert concept_map is None
+    assert default_renderer.draws == 0
+
+def test_map_returned_with_text():
+    renderer = CountingRenderer(output_format="png")
+    session = Session(Session.CATEGORY, "love", "ai")
+    text, concept_map = session.respond("1", renderer)
+    assert concept_map.startswith(b"\x89PNG")
+    session = Session(Session.CROSS_CATEGORY, "love", "human")
+    text, concept_map = session.respond("2", renderer)
+    assert "AI Concept Acquisition" in text and concept_map.startswith(b"\x89PNG")
+
+@pytest.mark.parametrize("record", [(Session.CONCEPT, "", ""),
+    (Session.CROSS_CATEGORY, "love", "ai"), (Session.ENDED, "3", "human")])
+def test_record_round_trip(record):
+    session = Session.from_record(record)
+    assert session.to_record() == record
+    assert Session.from_record(session.to_record()).prompt == session.prompt
+
+def test_store_multiplexes_and_survives_reload(tmp_path):
+    store = cas.SessionStore()
+    store.open("a")
+    store.open("b")
+    store.respond("a", "love")
+    store.respond("b", "fear")
+    store.respond("b", "human")
+    path = str(tmp_path / "sessions.json")
+    store.save(path)
+
+    loaded = cas.SessionStore.load(path, renderer=CountingRenderer(output_format="png"))
+    assert len(loaded) == 2 and "a" in loaded and "b" in loaded
+    text, concept_map, prompt, ended = loaded.respond("a", "ai")
+    assert "Available Categories" in text and concept_map is None and not ended
+    text, concept_map, prompt, ended = loaded.respond("a", "1")
+    assert concept_map.startswith(b"\x89PNG") and "another aspect" in prompt
+    text, concept_map, prompt, ended = loaded.respond("b", "1")
+    assert "Human Concept Acquisition" in text and concept_map is None
+
+def test_store_drops_ended_sessions():
+    store = cas.SessionStore()
+    store.open(1)
+    assert store.respond(1, "quit")[3]
+    assert 1 not in store and len(store) == 0
@@ -0,0 +1,94 @@
+"""
+Tests for the explanation cache, in particular that cache hits return the AI concept map and
+that only interactive renderers redraw it.
+"""
+import os
+import sys
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import ConceptAquisitionSimulation as cas
+
+class CountingRenderer(cas.ConceptMapRenderer):
+    """
+    Off-screen renderer counting its draws.
+    """
+    def __init__(self):
+        super().__init__(output_format="png")
+        self.draws = 0
+
+    def draw(self, *args, **kwargs):
+        self.draws += 1
+        return super().draw(*args, **kwargs)
+
+@pytest.fixture
+def renderer():
+    previous = cas.get_default_renderer()
+    renderer = CountingRenderer()
+    cas.set_default_renderer(renderer)
+    cas.explanation_cache.clear()
+    yield renderer
+    cas.set_default_renderer(previous)
+    cas.explanation_cache.clear()
+
+class InteractiveRenderer(cas.ConceptMapRenderer):
+    """
+    Renderer standing in for an interactive one, counting its draws without opening windows.
+    """
+    def __init__(self):
+        super().__init__(output_format=None)
+        self.draws = 0
+
+    def draw(self, *args, **kwargs):
+        self.draws += 1
+        return None
+
+def test_cache_hit_returns_cached_concept_map(renderer):
+    first = cas.chatbot_response("love", "ai", "memory retrieval")
+    second = cas.chatbot_response("love", "ai", "memory retrieval")
+    assert cas.explanation_cache.hits == 1
+    assert first[0] == second[0]
+    assert first[1].startswith(b"\x89PNG") and second[1] is first[1]
+    assert renderer.draws == 1
+    cas.chatbot_response("love", "ai", "emotional integration")
+    assert renderer.draws == 2
+
+def test_interactive_renderer_redraws_on_every_hit():
+    previous = cas.get_default_renderer()
+    renderer = InteractiveRenderer()
+    cas.set_default_renderer(renderer)
+    cas.explanation_cache.clear()
+    try:
+        for _ in range(3):
+            assert cas.chatbot_response("love", "ai", "memory retrieval")[1] is None
+    finally:
+        cas.set_default_renderer(previous)
+        cas.explanation_cache.clear()
+    assert renderer.draws == 3
+
+def test_written_map_is_redrawn_once_deleted(tmp_path):
+    renderer = cas.ConceptMapRenderer(output_format="png", output_dir=str(tmp_path))
+    cache = cas.ExplanationCache()
+    path = cache.get_concept_map("love", "memory retrieval", renderer)
+    assert cache.get_concept_map("love", "memory retrieval", renderer) == path
+    os.remove(path)
+    assert cache.get_concept_map("love", "memory retrieval", renderer) == path
+    assert os.path.exists(path)
+
+def test_concept_map_not_kept_on_shared_instance(renderer):
+    cas.chatbot_response("love", "ai", "memory retrieval")
+    assert not hasattr(cas.AICognition.for_concept("love"), "concept_map")
+
+def test_warm_up_does_not_render(renderer):
+    computed = cas.explanation_cache.warm_up()
+    assert computed == 2 * len(cas.registry) * len(cas.registry.categories)
+    assert renderer.draws == 0
+
+def test_human_response_has_no_map(renderer):
+    explanation, concept_map = cas.chatbot_response("love", "human", "memory retrieval")
+    assert "Human Concept Acquisition" in explanation
+    assert concept_map is None
+    assert cas.chatbot_explanation("love", "human", "memory retrieval") == explanation
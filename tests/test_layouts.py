@@ -0,0 +1,33 @@
+"""
+Tests for the scalable concept map layouts.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import networkx as nx
+import pytest
+
+import ConceptAquisitionSimulation as cas
+
+@pytest.mark.parametrize("graph", [
+    nx.path_graph(4), nx.star_graph(5), nx.DiGraph([(0, 1), (2, 1), (1, 3)]),
+    nx.Graph([(0, 1), (2, 3)]),
+], ids=["path", "star", "directed", "disconnected"])
+def test_radial_layout_places_every_node(graph):
+    pos = cas.radial_layout(graph)
+    assert set(pos) == set(graph)
+    assert all(-1 <= x <= 1 and -1 <= y <= 1 for x, y in pos.values())
+
+def test_radial_layout_ignores_edge_direction():
+    undirected = cas.radial_layout(nx.path_graph(4))
+    reversed_edges = nx.DiGraph()
+    reversed_edges.add_nodes_from(range(4))
+    reversed_edges.add_edges_from([(1, 0), (2, 1), (3, 2)])
+    directed = cas.radial_layout(reversed_edges)
+    assert all(directed[node] == pytest.approx(undirected[node]) for node in undirected)
+    # The hub sits at the centre and the far end of the path on the outer ring
+    assert undirected[0] == pytest.approx((0.0, 0.0), abs=1e-9)
+    radii = {node: abs(complex(*xy)) for node, xy in undirected.items()}
+    assert radii[3] == max(radii.values())
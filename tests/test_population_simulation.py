@@ -0,0 +1,65 @@
+"""
+Tests for the population simulation, in particular validation of its inputs.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+import ConceptAquisitionSimulation as cas
+
+@pytest.mark.parametrize("options", [
+    {"n_learners": 0}, {"n_learners": -3}, {"n_learners": 2.5}, {"concepts": []},
+    {"concepts": ["not a concept"]}, {"chunk_size": 0},
+    {"model_parameters": {"layers": 0, "hidden_units": 768}},
+    {"model_parameters": {"layers": 12}},
+    {"model_parameters": {"layers": 12, "hidden_units": "768"}},
+], ids=["no learners", "negative learners", "fractional learners", "no concepts",
+    "unknown concept", "empty chunks", "zero capacity", "missing hidden units",
+    "non-integer hidden units"])
+def test_invalid_inputs_raise_value_error(options):
+    arguments = {"n_learners": 10, "cognitive_system": "ai", **options}
+    with pytest.raises(ValueError):
+        cas.PopulationSimulation(**arguments)
+
+def test_defaults_use_default_model_parameters():
+    simulation = cas.PopulationSimulation(10, "ai")
+    assert simulation.model_parameters == cas.DEFAULT_MODEL_PARAMETERS
+    assert simulation.concepts == list(cas.registry.names)
+    assert simulation.parameters["learning_rate"][0] == pytest.approx(cas.PopulationSimulation
+        .AI_LEARNING_RATE)
+
+def test_smallest_capacity_still_learns():
+    simulation = cas.PopulationSimulation(100, "ai", concepts=["love"],
+        model_parameters={"layers": np.int64(1), "hidden_units": 1})
+    assert simulation.parameters["learning_rate"][0] > 0
+    simulation.step(20)
+    assert simulation.strength.max() > 0
+
+def test_existing_checkpoint_is_not_overwritten(tmp_path):
+    path = str(tmp_path / "run")
+    simulation = cas.PopulationSimulation(1000, "ai", path=path)
+    simulation.step(2)
+    simulation.checkpoint()
+    with pytest.raises(FileExistsError):
+        cas.PopulationSimulation(10, "ai", path=path)
+    resumed = cas.PopulationSimulation.resume(path)
+    assert resumed.n_learners == 1000
+    assert resumed.strength.shape == (1000, len(resumed.concepts))
+    assert resumed.step_count == 2
+
+def test_new_simulation_can_be_resumed_before_any_step(tmp_path):
+    path = str(tmp_path / "run")
+    cas.PopulationSimulation(10, "human", concepts=["love", "fear"], path=path)
+    resumed = cas.PopulationSimulation.resume(path)
+    assert resumed.strength.shape == (10, 2)
+    assert resumed.step_count == 0
+
+def test_human_salience_counts_listed_emotions():
+    simulation = cas.PopulationSimulation(10, "human", concepts=["freedom", "love"])
+    # freedom lists three emotions and love four, so love learns 4/3 as fast
+    rates = simulation.parameters["learning_rate"]
+    assert rates[1] / rates[0] == pytest.approx(4 / 3)
@@ -0,0 +1,49 @@
+"""
+Tests for the off-screen concept map renderers, in particular that request text cannot steer
+written files outside the output directory.
+"""
+import os
+import sys
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import ConceptAquisitionSimulation as cas
+
+def test_plain_names_are_unchanged():
+    assert cas.output_path("maps", "love_memory retrieval", "png") == os.path.join("maps",
+        "love_memory_retrieval.png")
+
+@pytest.mark.parametrize("stem", ["love_x/../../../escaped", "../love", "love_a\\b", "/etc/x"])
+def test_unsafe_names_stay_in_output_dir(stem):
+    path = cas.output_path("maps", stem, "png")
+    assert os.path.dirname(path) == "maps"
+    assert ".." not in os.path.basename(path)
+
+def test_distinct_stems_get_distinct_files():
+    assert cas.output_path("maps", "love_a/b", "png") != cas.output_path("maps", "love_a_b", "png")
+
+def test_concept_map_written_inside_output_dir(tmp_path):
+    renderer = cas.ConceptMapRenderer(output_format="png", output_dir=str(tmp_path))
+    path = cas.AICognition.for_concept("love").render_concept_map("x/../../../escaped", renderer)
+    assert os.path.dirname(path) == str(tmp_path)
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+def test_comparison_written_inside_output_dir(tmp_path):
+    renderer = cas.ComparisonRenderer(output_format="png", output_dir=str(tmp_path))
+    path = renderer.compare_systems("love", "x/../../escaped")
+    assert os.path.dirname(path) == str(tmp_path)
+
+@pytest.mark.parametrize("text", ["3", "lvoe", "Love"])
+def test_compare_concept_resolves_input(text):
+    renderer = cas.ComparisonRenderer(output_format="png")
+    expected = cas.resolve_concept(text)
+    assert cas.compare_concept(text, "ai", renderer=renderer).startswith(b"\x89PNG")
+    assert renderer._suptitle.get_text().count(f"'{expected}'") == 1
+
+@pytest.mark.parametrize("text", ["xyz", "f"])
+def test_compare_concept_rejects_unresolved_input(text):
+    with pytest.raises(ValueError):
+        cas.compare_concept(text, "ai", renderer=cas.ComparisonRenderer(output_format="png"))
@@ -0,0 +1,25 @@
+"""
+Tests for the concept similarity index.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ConceptAquisitionSimulation as cas
+
+def test_query_drops_unrelated_concepts():
+    results = cas.get_similarity_index().query("books and reading", 3)
+    assert results and len(results) <= 3
+    assert all(score > 0 for _, score in results)
+    assert results[0][0] == "knowledge"
+
+def test_query_without_shared_terms_is_empty():
+    assert cas.get_similarity_index().query("zxqv", 5) == []
+
+def test_related_concepts_exclude_self_and_unrelated():
+    related = cas.related_concepts("love", len(cas.registry))
+    assert "love" not in [name for name, _ in related]
+    assert all(score > 0 for _, score in related)
+    scores = [score for _, score in related]
+    assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,63 @@
+"""
+Tests for per-stage metrics, in particular that spans of renders in pool workers reach the
+parent's totals.
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import ConceptAquisitionSimulation as cas
+
+@pytest.fixture
+def metrics():
+    cas.stage_metrics.reset()
+    cas.stage_metrics.enable()
+    yield cas.stage_metrics
+    cas.stage_metrics.disable()
+    cas.stage_metrics.reset()
+
+def test_capture_collects_spans_without_recording(metrics):
+    with metrics.capture() as spans:
+        with metrics.span("layout"):
+            pass
+    assert [name for name, _, _ in spans] == ["layout"]
+    assert metrics.snapshot() == {}
+    metrics.merge(spans)
+    assert metrics.snapshot()["layout"]["calls"] == 1
+
+def test_capture_works_while_disabled():
+    with cas.stage_metrics.capture() as spans:
+        with cas.stage_metrics.span("draw"):
+            pass
+    assert len(spans) == 1
+    assert cas.stage_metrics.snapshot() == {}
+
+def test_batch_merges_worker_spans(metrics):
+    requests = [("love", "ai", "memory retrieval"), ("love", "ai", "memory retrieval"),
+        ("fear", "ai", "memory retrieval")]
+    with ProcessPoolExecutor(2) as executor:
+        results = list(cas.batch_explanations(requests, executor=executor))
+    assert all(concept_map.startswith(b"\x89PNG") for _, _, concept_map in results)
+    stages = metrics.snapshot()
+    # Two distinct renders, each timed once in its worker
+    for stage in ("build_graph", "layout", "draw", "save"):
+        assert stages[stage]["calls"] == 2
+
+def test_request_total_encloses_other_stages(metrics):
+    previous = cas.get_default_renderer()
+    cas.set_default_renderer(cas.ConceptMapRenderer(output_format="png"))
+    cas.explanation_cache.clear()
+    try:
+        cas.chatbot_explanation("love", "ai", "memory retrieval")
+    finally:
+        cas.set_default_renderer(previous)
+        cas.explanation_cache.clear()
+    stages = metrics.snapshot()
+    assert "explanation" not in stages
+    inner = sum(stages[stage]["seconds_total"] for stage in ("assemble_text", "draw", "save"))
+    assert stages["request_total"]["seconds_total"] >= inner
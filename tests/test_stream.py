@@ -0,0 +1,53 @@
+"""
+Tests for JSON Lines stream mode, in particular that a failing request is answered with an
+error without ending the stream.
+"""
+import io
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ConceptAquisitionSimulation as cas
+
+def request(user_input, cognitive_system, category, request_id):
+    return json.dumps({"id": request_id, "user_input": user_input,
+        "cognitive_system": cognitive_system, "category": category}) + "\n"
+
+def run(lines, **options):
+    """
+    :param lines: list of str, the JSON Lines input
+    :return: list of dict, the responses written
+    """
+    outfile = io.StringIO()
+    with ThreadPoolExecutor(2) as executor:
+        cas.run_stream(lines, outfile, executor=executor, **options)
+    return [json.loads(line) for line in outfile.getvalue().splitlines()]
+
+def test_render_failure_is_reported_per_request(monkeypatch):
+    render = cas.render_concept_map_offscreen
+
+    def failing_render(concept, category, *args):
+        if concept == "fear":
+            raise RuntimeError("disk full")
+        return render(concept, category, *args)
+
+    monkeypatch.setattr(cas, "render_concept_map_offscreen", failing_render)
+    responses = run([
+        request("fear", "ai", "memory retrieval", 1),
+        "not json\n",
+        request("love", "ai", "memory retrieval", 2),
+        request("love", "human", "memory retrieval", 3),
+    ])
+    assert [response["id"] for response in responses] == [1, None, 2, 3]
+    failed, malformed, rendered, human = responses
+    assert "disk full" in failed["error"]
+    assert failed["concept_map"] is None
+    assert "AI Concept Acquisition" in failed["explanation"]
+    assert malformed["error"].startswith("Malformed request")
+    assert malformed["explanation"] == malformed["error"]
+    assert rendered["error"] is None and rendered["concept_map"]
+    assert human["error"] is None and human["concept_map"] is None